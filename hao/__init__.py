@@ -4,9 +4,11 @@ from . import (
     asyncs,
     charsets,
     config,
+    crc64,
     currencies,
     dates,
     decorators,
+    dedup,
     dicts,
     english,
     envs,
@@ -1,4 +1,27 @@
 # -*- coding: utf-8 -*-
+"""
+####################################################
+###########          usage              ############
+####################################################
+from hao import charsets
+
+# raw bytes: BOM, then <meta charset> / <?xml encoding> in the first `scan_size` bytes, then sniffing a capped sample
+encoding = charsets.detect_encoding(content)
+text = charsets.decode(content)
+
+# streaming http bodies
+decoder = charsets.IncrementalDecoder(encoding=charset_from_headers)
+for chunk in response.iter_content(chunk_size=64 * 1024):
+    text = decoder.decode(chunk)
+text = decoder.decode(b'', final=True)
+
+# or
+for text in charsets.decode_stream(response.iter_content(chunk_size=64 * 1024)):
+    ...
+"""
+import codecs
+from collections.abc import Generator, Iterable
+
 import regex
 from charset_normalizer import from_bytes
 
@@ -7,6 +30,23 @@ from . import lists
 RE_CHARSET = regex.compile(r'<meta.*?charset=["\']*(.+?)["\'>]', flags=regex.I)
 RE_CONTENT_LANGUAGE = regex.compile(r'<meta.*Content-Language:(.+?)[;"\'>]')
 RE_PRAGMA = regex.compile(r'<meta.*?content=["\']*;?charset=(.+?)["\'>]', flags=regex.I)
+RE_DECLARED_BYTES = regex.compile(
+    rb'<meta\b[^>]*?charset\s*=\s*["\']?\s*([\w.:-]+)'
+    rb'|<\?xml\b[^>]*?encoding\s*=\s*["\']([\w.:-]+)',
+    flags=regex.I,
+)
+
+SCAN_SIZE = 16 * 1024
+SNIFF_SIZE = 64 * 1024
+
+# longer boms first, utf-32-le starts with the utf-16-le bom
+BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
 
 STANDARD_ENCODINGS = [
     "ASMO-708",
@@ -190,8 +230,15 @@ def get_declared_encodings(html_text, uniquify=False):
     return encodings
 
 
-def guess_encoding(html_text):
-    text = regex.sub("<.*?>", " ", html_text)
+def guess_encoding(html_text: str | bytes, sniff_size: int = SNIFF_SIZE):
+    """
+    :param html_text: str, or raw bytes, which are sniffed as is instead of being re-encoded
+    :param sniff_size: only the first `sniff_size` chars / bytes are sniffed
+    """
+    if isinstance(html_text, bytes):
+        encoding = sniff_encoding(html_text, sniff_size)
+        return fix_encoding_name(encoding) if encoding else 'utf-8'
+    text = regex.sub("<.*?>", " ", html_text[:sniff_size])
     encodding = from_bytes(text.encode()).best()
     return fix_encoding_name(encodding.encoding)
 
@@ -204,3 +251,151 @@ def fix_encoding(text: str, encoding: str | None = None):
         except UnicodeDecodeError:
             pass
     return text
+
+
+def lookup_encoding(encoding: str | bytes | None) -> str | None:
+    """
+    normalized python codec name of the encoding label, `CHARSETS` preferred; None if unknown
+    """
+    if not encoding:
+        return None
+    if isinstance(encoding, bytes):
+        encoding = encoding.decode('ascii', errors='ignore')
+    encoding = encoding.strip().lower()
+    if encoding in CHARSETS:
+        return CHARSETS[encoding]
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return None
+
+
+def detect_bom(data: bytes) -> tuple[str | None, int]:
+    """
+    :return: (encoding, bom length), (None, 0) if no bom
+    """
+    if data:
+        for bom, encoding in BOMS:
+            if data.startswith(bom):
+                return encoding, len(bom)
+    return None, 0
+
+
+def get_declared_encoding(data: bytes, scan_size: int = SCAN_SIZE) -> str | None:
+    """
+    the first valid `<meta charset>`, `<meta content="...; charset=">` or `<?xml encoding>` in the first `scan_size` bytes
+    """
+    if not data:
+        return None
+    for m in RE_DECLARED_BYTES.finditer(data, 0, scan_size):
+        encoding = lookup_encoding(m.group(1) or m.group(2))
+        if encoding is None:
+            continue
+        # a declaration readable as ascii can't be utf-16 / utf-32
+        if encoding.startswith(('utf-16', 'utf-32')):
+            return 'utf-8'
+        return encoding
+    return None
+
+
+def sniff_encoding(data: bytes, sniff_size: int = SNIFF_SIZE) -> str | None:
+    """
+    `charset_normalizer` on the first `sniff_size` bytes, trimmed to not end in the middle of a multi-byte char
+    """
+    if not data:
+        return None
+    sample = data[:sniff_size]
+    if len(sample) < len(data):
+        for i in range(len(sample) - 1, max(len(sample) - 8, 0) - 1, -1):
+            if sample[i] < 0x80:
+                sample = sample[:i + 1]
+                break
+    best = from_bytes(sample).best()
+    return lookup_encoding(best.encoding) if best else None
+
+
+def detect_encoding(data: bytes,
+                    encoding: str | None = None,
+                    scan_size: int = SCAN_SIZE,
+                    sniff_size: int = SNIFF_SIZE,
+                    default: str = 'utf-8') -> str:
+    """
+    bom, then `encoding` (e.g. from the content-type header), then declared in the first `scan_size` bytes,
+    then sniffed from the first `sniff_size` bytes
+    """
+    return _detect(data, encoding, scan_size, sniff_size, default)[0]
+
+
+def _detect(data: bytes, encoding: str | None, scan_size: int, sniff_size: int, default: str) -> tuple[str, int]:
+    bom_encoding, bom_size = detect_bom(data)
+    if bom_encoding:
+        return bom_encoding, bom_size
+    encoding = (
+        lookup_encoding(encoding)
+        or get_declared_encoding(data, scan_size)
+        or (sniff_encoding(data, sniff_size) if sniff_size else None)
+        or default
+    )
+    return encoding, 0
+
+
+def decode(data: bytes,
+           encoding: str | None = None,
+           errors: str = 'replace',
+           scan_size: int = SCAN_SIZE,
+           sniff_size: int = SNIFF_SIZE) -> str:
+    """
+    decodes with the `detect_encoding` encoding, bom stripped
+    """
+    if data is None:
+        return None
+    encoding, bom_size = _detect(data, encoding, scan_size, sniff_size, 'utf-8')
+    return codecs.decode(data[bom_size:], encoding, errors)
+
+
+class IncrementalDecoder:
+    """
+    Decodes a byte stream (e.g. http body) chunk by chunk, buffers until `scan_size` bytes received (or final)
+    to detect the encoding, see `detect_encoding`.
+    """
+
+    def __init__(self,
+                 encoding: str | None = None,
+                 errors: str = 'replace',
+                 scan_size: int = SCAN_SIZE,
+                 sniff_size: int = SNIFF_SIZE) -> None:
+        super().__init__()
+        self.declared = encoding
+        self.errors = errors
+        self.scan_size = scan_size
+        self.sniff_size = sniff_size
+        self.encoding: str | None = None
+        self._buffer = bytearray()
+        self._decoder = None
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        if self._decoder is not None:
+            return self._decoder.decode(data, final)
+        self._buffer += data
+        if len(self._buffer) < max(self.scan_size, 4) and not final:
+            return ''
+        buffer = bytes(self._buffer)
+        self._buffer = bytearray()
+        self.encoding, bom_size = _detect(buffer, self.declared, self.scan_size, self.sniff_size, 'utf-8')
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(self.errors)
+        return self._decoder.decode(buffer[bom_size:], final)
+
+
+def decode_stream(chunks: Iterable[bytes],
+                  encoding: str | None = None,
+                  errors: str = 'replace',
+                  scan_size: int = SCAN_SIZE,
+                  sniff_size: int = SNIFF_SIZE) -> Generator[str, None, None]:
+    decoder = IncrementalDecoder(encoding, errors, scan_size, sniff_size)
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+CRC64-ECMA (as in `x-oss-hash-crc64ecma`, same as `oss2.utils.Crc64`), table-driven,
+with crc combination to compute file segments in parallel.
+
+####################################################
+###########          usage              ############
+####################################################
+from hao import crc64
+
+crc = crc64.crc64(b'123456789')                # 0x995dc9bbdf1939fa
+crc = crc64.crc64(b'more data', crc)            # continue from a previous crc
+crc = crc64.combine(crc_a, crc_b, len_b)        # crc of a + b, from crcs of a and b
+crc = crc64.file_crc64('path/to/file', workers=8)
+"""
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from crcmod._crcfunext import _crc64r as _native_crc64r
+except ImportError:
+    _native_crc64r = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+POLY = 0xC96C5795D7870F42  # reflected 0x42F0E1EBA9EA3693
+MASK = 0xFFFFFFFFFFFFFFFF
+SEGMENT_SIZE = 64 * 1024 * 1024
+
+N_LANES = 2048
+
+_TABLES = None
+_NATIVE_TABLE = None
+_LANE_TABLE = None
+_X2N_TABLE = None
+
+
+def _tables() -> list[list[int]]:
+    """
+    slice-by-8 tables, `tables[k][i]` is the crc of byte `i` followed by `k` zero bytes
+    """
+    global _TABLES
+    if _TABLES is None:
+        table = []
+        for i in range(256):
+            crc = i
+            for _ in range(8):
+                crc = (crc >> 1) ^ POLY if crc & 1 else crc >> 1
+            table.append(crc)
+        tables = [table]
+        for _ in range(7):
+            previous = tables[-1]
+            tables.append([(crc >> 8) ^ table[crc & 0xFF] for crc in previous])
+        _TABLES = tables
+    return _TABLES
+
+
+def _update_native(crc: int, data) -> int:
+    global _NATIVE_TABLE
+    if _NATIVE_TABLE is None:
+        _NATIVE_TABLE = struct.pack('=256Q', *_tables()[0])
+    return _native_crc64r(data, crc, _NATIVE_TABLE)
+
+
+def _update_slice8(crc: int, data) -> int:
+    t0, t1, t2, t3, t4, t5, t6, t7 = _tables()
+    view = memoryview(data).cast('B')
+    n8 = len(view) & ~7
+    for (word,) in struct.iter_unpack('<Q', view[:n8]):
+        crc ^= word
+        crc = (
+            t7[crc & 0xFF] ^ t6[(crc >> 8) & 0xFF] ^ t5[(crc >> 16) & 0xFF] ^ t4[(crc >> 24) & 0xFF]
+            ^ t3[(crc >> 32) & 0xFF] ^ t2[(crc >> 40) & 0xFF] ^ t1[(crc >> 48) & 0xFF] ^ t0[crc >> 56]
+        )
+    for byte in view[n8:]:
+        crc = t0[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc
+
+
+def _update_lanes(crc: int, data) -> int:
+    """
+    slice-by-8 in numpy, over `N_LANES` equal lanes side by side, lane crcs then combined, the rest in python
+    """
+    global _LANE_TABLE
+    view = memoryview(data).cast('B')
+    lane_size = (len(view) // N_LANES) & ~7
+    if lane_size < 1024:
+        return _update_slice8(crc, view)
+    if _LANE_TABLE is None:
+        # byte k of the little-endian word is looked up in table 7 - k
+        _LANE_TABLE = np.array(_tables()[::-1], dtype=np.uint64).reshape(-1)
+    offsets = np.arange(8, dtype=np.uint16) * 256
+    words = np.frombuffer(view[:N_LANES * lane_size], dtype='<u8').reshape(N_LANES, -1).T.copy()
+    lanes = np.full(N_LANES, MASK, dtype=np.uint64)
+    indices = np.empty((N_LANES, 8), dtype=np.uint16)
+    for word in words:
+        lanes ^= word
+        np.add(lanes.view(np.uint8).reshape(N_LANES, 8), offsets, out=indices)
+        lanes = np.bitwise_xor.reduce(_LANE_TABLE.take(indices), axis=1)
+    shift = _x2nmodp(lane_size, 3)
+    crc ^= MASK
+    for lane in (lanes ^ np.uint64(MASK)).tolist():
+        crc = _multmodp(shift, crc) ^ lane
+    return _update_slice8(crc ^ MASK, view[N_LANES * lane_size:])
+
+
+def _update_python(crc: int, data) -> int:
+    return _update_lanes(crc, data) if np is not None else _update_slice8(crc, data)
+
+
+# the C loop from crcmod's extension if compiled, otherwise numpy lanes / slice-by-8 in python
+_update = _update_native if _native_crc64r is not None else _update_python
+
+
+def crc64(data, crc: int = 0) -> int:
+    """
+    :param data: bytes-like, e.g. bytes, memoryview, mmap
+    :param crc: crc of the preceding data, to continue from
+    """
+    return _update(crc ^ MASK, data) ^ MASK
+
+
+def _multmodp(a: int, b: int) -> int:
+    """
+    a * b modulo the polynomial, in the reflected bit order
+    """
+    m, p = 1 << 63, 0
+    while True:
+        if a & m:
+            p ^= b
+            if (a & (m - 1)) == 0:
+                break
+        m >>= 1
+        b = (b >> 1) ^ POLY if b & 1 else b >> 1
+    return p
+
+
+def _x2nmodp(n: int, k: int) -> int:
+    """
+    x ^ (n * 2 ^ k) modulo the polynomial
+    """
+    global _X2N_TABLE
+    if _X2N_TABLE is None:
+        table, p = [], 1 << 62  # x ^ 1
+        for _ in range(64):
+            table.append(p)
+            p = _multmodp(p, p)
+        _X2N_TABLE = table
+    p = 1 << 63  # x ^ 0
+    while n:
+        if n & 1:
+            p = _multmodp(_X2N_TABLE[k & 63], p)
+        n >>= 1
+        k += 1
+    return p
+
+
+def combine(crc1: int, crc2: int, len2: int) -> int:
+    """
+    crc of the concatenation, from `crc1` of the first part, and `crc2` / `len2` of the second part, as in zlib
+    """
+    if len2 <= 0:
+        return crc1
+    return _multmodp(_x2nmodp(len2, 3), crc1) ^ crc2
+
+
+def file_crc64(path: str, crc: int = 0, workers: int = 1, segment_size: int = SEGMENT_SIZE) -> int:
+    """
+    crc of the file read through mmap, segments computed in a process pool and combined
+    :param workers: number of processes, None for cpu count
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return crc
+    workers = workers or os.cpu_count() or 1
+    segments = [(start, min(start + segment_size, size)) for start in range(0, size, segment_size)]
+    if workers == 1 or len(segments) == 1:
+        return crc64_range(path, 0, size, crc)
+    with ProcessPoolExecutor(max_workers=min(workers, len(segments))) as executor:
+        starts, ends = zip(*segments)
+        for (start, end), segment_crc in zip(segments, executor.map(crc64_range, [path] * len(segments), starts, ends)):
+            crc = combine(crc, segment_crc, end - start)
+    return crc
+
+
+def crc64_range(path: str, start: int, end: int, crc: int = 0) -> int:
+    """
+    crc of the byte range [start, end) of the file, read through mmap
+    """
+    if end <= start:
+        return crc
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        with memoryview(buffer) as view:
+            return crc64(view[start:end], crc)
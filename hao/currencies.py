@@ -1,4 +1,9 @@
 # -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import regex
 
 CN_NUM = {
     '〇': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5, '六': 6, '七': 7, '八': 8, '九': 9,
@@ -60,3 +65,153 @@ def chinese_to_digits(text: str) -> int:
             tmp += x
     val += tmp
     return val
+
+
+CN_BIG_UNIT = {
+    '万': 10000,
+    '萬': 10000,
+    '亿': 100000000,
+    '億': 100000000,
+    '兆': 1000000000000,
+}
+
+CURRENCY_UNITS = {
+    '人民币': '元',
+    'RMB': '元',
+    'CNY': '元',
+    '￥': '元',
+    '¥': '元',
+    '圆': '元',
+    '块': '元',
+    'USD': '美元',
+    'US$': '美元',
+    '$': '美元',
+    'HK$': '港元',
+    '港币': '港元',
+}
+
+_CN_CHARS = ''.join(CN_NUM) + ''.join(c for c, unit in CN_UNIT.items() if unit >= 10)
+_CN_DIGITS = ''.join(CN_NUM)
+# numerals on their own, unlike the magnitudes as in the `单位：万元` table headers; `十元` is ten
+_CN_NUMERALS = _CN_DIGITS + '十拾'
+P_NUMBER = regex.compile(r'(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?')
+P_AMOUNT = regex.compile(
+    r'(?:(?P<prefix>人民币|RMB|CNY|USD|US\$|HK\$|\$|￥|¥)\s*[:：]?\s*)?'
+    r'(?P<num>(?=[' + _CN_CHARS + r'点]*[\d' + _CN_NUMERALS + r'])'
+    r'(?:(?<![\d.,])(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:\s+(?=[' + _CN_CHARS + r']))?|[' + _CN_CHARS + r'])'
+    r'(?:[' + _CN_CHARS + r'点]|(?<=[' + _CN_CHARS + r'点])\d+(?:\.\d+)?)*'
+    r')'
+    r'(?:\s*(?P<unit>元|圆|块|美元|港元|港币|欧元|日元|英镑)'
+    r'(?:(?P<jiao>[' + _CN_DIGITS + r'\d])[角毛])?(?:[零〇]?(?P<fen>[' + _CN_DIGITS + r'\d])分)?(?:整|正)?)?'
+)
+
+
+@dataclass
+class Amount:
+    start: int
+    end: int
+    text: str
+    value: float
+    unit: str
+
+    @property
+    def span(self) -> tuple[int, int]:
+        return self.start, self.end
+
+
+def to_number(text: str) -> float | None:
+    """
+    Mixed Arabic / Chinese numerals with decimals, e.g. `1.2亿`, `1,234.5万`, `壹佰贰拾万`, `三点五万`, `3亿5千万`,
+    None without any numeral, e.g. `万`
+    """
+    if not text:
+        return None
+    total, section, number = 0, 0, 0
+    has_numeral = False
+    decimals = None
+    i, size = 0, len(text)
+    while i < size:
+        c = text[i]
+        if c.isdigit():
+            j = i
+            while j < size and (text[j].isdigit() or text[j] in '.,'):
+                j += 1
+            digits = text[i:j]
+            if decimals is not None:
+                # the fraction after `点`, e.g. `1点5`
+                if not digits.isdigit():
+                    return None
+                for d in digits:
+                    decimals /= 10
+                    number += int(d) * decimals
+            elif P_NUMBER.fullmatch(digits):
+                number = float(digits.replace(',', ''))
+            else:
+                return None
+            has_numeral = True
+            i = j
+            continue
+        if c in _CN_NUMERALS:
+            has_numeral = True
+        if c in CN_NUM:
+            if decimals is not None:
+                decimals /= 10
+                number += CN_NUM[c] * decimals
+            else:
+                number = CN_NUM[c]
+        elif c == '点':
+            decimals = 1
+        elif c in CN_BIG_UNIT:
+            unit = CN_BIG_UNIT[c]
+            if unit > 10000:
+                total = (total + section + number) * unit
+            else:
+                total += (section + number) * unit
+            section, number, decimals = 0, 0, None
+        elif c in CN_UNIT and CN_UNIT[c] >= 10:
+            section += (number or 1) * CN_UNIT[c]
+            number, decimals = 0, None
+        elif not c.isspace():
+            return None
+        i += 1
+    if not has_numeral:
+        return None
+    return total + section + number
+
+
+def extract_amounts(text: str) -> list[Amount]:
+    """
+    Finds the amounts like `人民币壹佰贰拾万元整`, `1.2亿元`, `¥1,200.50`, `3万5千元`, `伍拾元伍角` in one scan,
+    with value normalized in the `unit` (元, 美元, 港元...); a number is an amount only with a currency prefix or unit.
+    """
+    if not text:
+        return []
+    amounts = []
+    for m in P_AMOUNT.finditer(text):
+        prefix, unit = m.group('prefix'), m.group('unit')
+        if prefix is None and unit is None:
+            continue
+        value = to_number(m.group('num'))
+        if value is None:
+            continue
+        for name, factor in (('jiao', 0.1), ('fen', 0.01)):
+            digit = m.group(name)
+            if digit is not None:
+                value += (int(digit) if digit.isdigit() else CN_NUM[digit]) * factor
+        unit = CURRENCY_UNITS.get(unit or prefix, unit or prefix)
+        amounts.append(Amount(m.start(), m.end(), m.group(), round(float(value), 2), unit))
+    return amounts
+
+
+def extract_amounts_many(texts: list[str], workers: int | None = None, pool_threshold: int = 1000) -> list[list[Amount]]:
+    """
+    `extract_amounts` over many documents, in a process pool if there are at least `pool_threshold` of them
+    :param workers: number of processes, default to cpu count, 1 to disable the pool
+    """
+    if texts is None:
+        return None
+    if len(texts) < pool_threshold or workers == 1:
+        return [extract_amounts(text) for text in texts]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_amounts, texts, chunksize=max(1, len(texts) // (4 * workers))))
@@ -2,7 +2,12 @@
 import calendar
 import datetime
 import os
+import threading
 import time
+import zoneinfo
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 
 import dateparser
 import regex
@@ -82,6 +87,43 @@ RULES_NORMALIZE = [
 P_ZH_DATE = regex.compile('[年月日号]')
 P_ZH_TIME = regex.compile('[时分秒]')
 
+P_FAST_ISO = regex.compile(
+    r'(\d{4})([-/.])(\d{1,2})\2(\d{1,2})'
+    r'(?:(?:T|\s+)(\d{1,2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?'
+    r'\s*(Z|[+-]\d{2}:?\d{2})?'
+)
+P_FAST_COMPACT = regex.compile(r'(\d{4})(\d{2})(\d{2})')
+P_FAST_ZH = regex.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})[日号](?:(\d{1,2})[时点](\d{1,2})分(?:(\d{1,2})秒)?)?')
+P_FAST_EPOCH = regex.compile(r'\d{10}|\d{13}')
+
+
+def _pattern_extract(i: int, partial: bool = False) -> str:
+    year_zh = rf'(?P<y{i}>(?:19|20)\d{{2}}|[〇一二三四五六七八九零○O◯]{{4}})\s*年'
+    month_zh = rf'(?P<m{i}>1[0-2]|0?[1-9]|十[一二]?|[一二三四五六七八九])\s*月'
+    day_zh = rf'(?P<d{i}>3[01]|[12]\d|0?[1-9]|[二三]?十[一二三四五六七八九]?|廿[一二三四五六七八九]?|卅一?|[一二三四五六七八九])\s*[日号]'
+    time = (
+        rf'(?:\s*T?\s*(?P<H{i}>2[0-3]|[01]?\d)\s*[时点:：]\s*(?P<M{i}>[0-5]?\d)(?!\d)(?:\s*分)?'
+        rf'(?:\s*[:：]?\s*(?P<S{i}>[0-5]?\d)(?!\d)(?:\s*秒)?)?)?'
+    )
+    month = rf'(?P<m{i}>1[0-2]|0?[1-9])'
+    day = rf'(?P<d{i}>3[01]|[12]\d|0?[1-9])'
+    alternatives = [
+        rf'{year_zh}\s*{month_zh}\s*{day_zh}{time}',
+        rf'(?<!\d)(?P<y{i}>(?:19|20)\d{{2}})(?P<sep{i}>[-/.]){month}(?P=sep{i}){day}(?!\d){time}',
+        rf'(?<!\d)(?P<y{i}>(?:19|20)\d{{2}})(?P<m{i}>0[1-9]|1[0-2])(?P<d{i}>0[1-9]|[12]\d|3[01])(?!\d)',
+    ]
+    if partial:
+        alternatives.append(rf'{month_zh}\s*{day_zh}{time}')
+        alternatives.append(rf'{day_zh}{time}')
+    else:
+        alternatives.append(rf'{year_zh}\s*{month_zh}')
+    return '|'.join([f'(?:{alternative})' for alternative in alternatives])
+
+
+P_RANGE_SEPARATOR = r'\s*(?:至|到|~|～|－|—|–|-|to)\s*'
+P_EXTRACT = regex.compile(f'(?:{_pattern_extract(1)})')
+P_EXTRACT_RANGE = regex.compile(f'(?:{_pattern_extract(1)})(?:{P_RANGE_SEPARATOR}(?:{_pattern_extract(2, partial=True)}))?')
+
 
 def parse(value, timezone='Asia/Shanghai', keep_timezone: bool = False):
     if value is None:
@@ -96,6 +138,21 @@ def parse(value, timezone='Asia/Shanghai', keep_timezone: bool = False):
     if isinstance(value, int):
         return epoch_to_datetime(value)
 
+    if _CACHE is None:
+        return _parse_text(value, timezone, keep_timezone)
+    key = (value.strip(), timezone, keep_timezone)
+    date = _CACHE.get(key, _MISSING)
+    if date is _MISSING:
+        date = _parse_text(value, timezone, keep_timezone)
+        _CACHE.put(key, date)
+    return date
+
+
+def _parse_text(value: str, timezone='Asia/Shanghai', keep_timezone: bool = False):
+    date = parse_fast(value, timezone, keep_timezone)
+    if date is not None:
+        return date
+
     text = value
     text = normalize_chinese(text)
     for p, sub in RULES_NORMALIZE:
@@ -120,6 +177,221 @@ def parse(value, timezone='Asia/Shanghai', keep_timezone: bool = False):
         return None
 
 
+def _parse_text_args(args):
+    return _parse_text(*args)
+
+
+def parse_many(values: list,
+               timezone='Asia/Shanghai',
+               keep_timezone: bool = False,
+               workers: int | None = None,
+               pool_threshold: int = 2000) -> list:
+    """
+    Parses each distinct value once, and returns the results aligned with `values`.
+    Uses the cache if enabled (see `enable_cache`), and a process pool for the misses when there are at least `pool_threshold` of them.
+    :param workers: number of processes, default to cpu count, 1 to disable the pool
+    """
+    if values is None:
+        return None
+    results = {}
+    misses = []
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        key = value.strip()
+        if key in results:
+            continue
+        date = _MISSING if _CACHE is None else _CACHE.get((key, timezone, keep_timezone), _MISSING)
+        results[key] = date
+        if date is _MISSING:
+            misses.append(key)
+
+    if len(misses) >= pool_threshold and workers != 1:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_size = max(1, len(misses) // (4 * workers))
+            args = [(key, timezone, keep_timezone) for key in misses]
+            parsed = list(executor.map(_parse_text_args, args, chunksize=chunk_size))
+    else:
+        parsed = [_parse_text(key, timezone, keep_timezone) for key in misses]
+    for key, date in zip(misses, parsed):
+        results[key] = date
+        if _CACHE is not None:
+            _CACHE.put((key, timezone, keep_timezone), date)
+
+    return [results[value.strip()] if isinstance(value, str) else parse(value, timezone, keep_timezone) for value in values]
+
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    maxsize: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class _LRUCache:
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+_MISSING = object()
+_CACHE: _LRUCache | None = None
+
+
+def enable_cache(maxsize: int = 100_000):
+    """
+    Caches the results of `parse` / `parse_many` / `formatted` for str values, keyed by (stripped value, timezone, keep_timezone).
+    Relative expressions (e.g. `3 days ago`) are cached as first resolved.
+    """
+    global _CACHE
+    assert maxsize > 0, 'maxsize should be positive'
+    _CACHE = _LRUCache(maxsize)
+
+
+def disable_cache():
+    global _CACHE
+    _CACHE = None
+
+
+def cache_info() -> CacheInfo | None:
+    return _CACHE.info() if _CACHE is not None else None
+
+
+def parse_fast(text: str, timezone='Asia/Shanghai', keep_timezone: bool = False):
+    """
+    Builds the datetime directly for the common formats: ISO 8601 (`-`, `/`, `.` as separators), `YYYYMMDD`,
+    `YYYY年MM月DD日` (optionally with `HH时MM分SS秒`) and epoch strings (10 digits in seconds, 13 in milliseconds).
+    :return: None if not any of them, or not a valid date, to fall back to `parse`
+    """
+    text = text.strip()
+    try:
+        if m := P_FAST_ISO.fullmatch(text):
+            year, _, month, day, hour, minute, second, fraction, tz = m.groups()
+            date = datetime.datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0), int((fraction or '0').ljust(6, '0'))
+            )
+            if tz is not None and keep_timezone:
+                date = date.replace(tzinfo=_fixed_timezone(tz))
+            return date
+        if m := P_FAST_COMPACT.fullmatch(text):
+            return datetime.datetime(*map(int, m.groups()))
+        if m := P_FAST_ZH.fullmatch(text):
+            return datetime.datetime(*[int(v) for v in m.groups() if v is not None])
+        if P_FAST_EPOCH.fullmatch(text):
+            seconds = int(text) / 1000 if len(text) == 13 else int(text)
+            return datetime.datetime.fromtimestamp(seconds, zoneinfo.ZoneInfo(timezone)).replace(tzinfo=None)
+    except (ValueError, OverflowError, zoneinfo.ZoneInfoNotFoundError):
+        return None
+    return None
+
+
+def _fixed_timezone(tz: str):
+    if tz == 'Z':
+        return datetime.timezone.utc
+    sign = -1 if tz[0] == '-' else 1
+    tz = tz[1:].replace(':', '')
+    return datetime.timezone(sign * datetime.timedelta(hours=int(tz[:2]), minutes=int(tz[2:])))
+
+
+@dataclass
+class DateMention:
+    start: int
+    end: int
+    text: str
+    value: datetime.datetime
+    value_end: datetime.datetime | None = None
+
+    @property
+    def span(self) -> tuple[int, int]:
+        return self.start, self.end
+
+    @property
+    def is_range(self) -> bool:
+        return self.value_end is not None
+
+
+def extract(text: str, ranges: bool = True) -> list[DateMention]:
+    """
+    Finds the date / datetime mentions in free text in a single scan, e.g.
+        `2024-05-01 12:00`, `2024/5/1`, `20240501`, `2024年5月1日12时30分`, `二〇二四年五月一日`, `2024年5月`,
+    and ranges (if `ranges`) like `2024年5月1日至3日`, `2024-05-01 ~ 2024-05-03`, `value_end` being the end of range.
+    Partial end of range (e.g. `5月3日`, `3日`) inherits the year / month of the start.
+    """
+    if not text:
+        return []
+    mentions = []
+    p = P_EXTRACT_RANGE if ranges else P_EXTRACT
+    for m in p.finditer(text):
+        try:
+            value = _mention_to_datetime(m, 1)
+        except ValueError:
+            continue
+        value_end = None
+        if ranges and m.group('d2') is not None:
+            try:
+                value_end = _mention_to_datetime(m, 2, value)
+            except ValueError:
+                pass
+        start, end = m.span()
+        mentions.append(DateMention(start, end, m.group(), value, value_end))
+    return mentions
+
+
+def _mention_to_datetime(m, i: int, base: datetime.datetime | None = None) -> datetime.datetime:
+    def number(name: str, mapping: dict, default=None):
+        value = m.group(f"{name}{i}")
+        if value is None:
+            return default
+        if value.isdigit():
+            return int(value)
+        digits = ''.join([mapping.get(c, c) for c in value if not c.isspace()])
+        if mapping is not CHAR_MAPPING_YEAR and len(digits) > 2:
+            digits = f"{digits[0]}{digits[-1]}"
+        return int(digits)
+
+    year = number('y', CHAR_MAPPING_YEAR, base.year if base else None)
+    month = number('m', CHAR_MAPPING_MONTH, base.month if base else None)
+    day = number('d', CHAR_MAPPING_DAY, 1)
+    return datetime.datetime(
+        year, month, day,
+        number('H', CHAR_MAPPING_DAY, 0), number('M', CHAR_MAPPING_DAY, 0), number('S', CHAR_MAPPING_DAY, 0)
+    )
+
+
 def normalize_chinese(text: str):
     if P_ZH_TIME.search(text) is not None:
         return text
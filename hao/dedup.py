@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Near-duplicate detection, MinHash (with LSH banding) for jaccard similarity, SimHash for hamming distance.
+
+####################################################
+###########          usage              ############
+####################################################
+from hao.dedup import MinHashLSH, SimHashIndex
+
+lsh = MinHashLSH(threshold=0.8)
+for key, text in docs:
+    duplicates = lsh.insert_unique(key, text)   # inserted only if no near-duplicates found
+lsh.query(text)                                 # keys of candidate near-duplicates
+lsh.save('data/dedup.lsh')
+lsh = MinHashLSH.load('data/dedup.lsh')
+
+index = SimHashIndex(distance=3)
+index.insert(key, text)
+index.query(text)
+
+# batch, returns numpy.ndarray if numpy installed
+signatures = lsh.minhash.signatures(texts)
+fingerprints = simhashes(texts)
+"""
+import hashlib
+import pickle
+import random
+import struct
+from collections import Counter, defaultdict
+
+from . import paths, strings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+MASK_64 = (1 << 64) - 1
+
+
+def canonicalize(text: str) -> str:
+    if text is None:
+        return ''
+    text = strings.normalize(text) or ''
+    return ' '.join(text.lower().split())
+
+
+def shingles(text: str, ngram: int = 5, normalize: bool = True) -> set[str]:
+    if normalize:
+        text = canonicalize(text)
+    if not text:
+        return set()
+    if len(text) <= ngram:
+        return {text}
+    return {text[i:i + ngram] for i in range(len(text) - ngram + 1)}
+
+
+def hash32(text: str) -> int:
+    return int.from_bytes(hashlib.sha1(text.encode('utf-8')).digest()[:4], 'little')
+
+
+def hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def jaccard(signature_a, signature_b) -> float:
+    if len(signature_a) != len(signature_b):
+        raise ValueError(f"signature length mismatch: {len(signature_a)} vs {len(signature_b)}")
+    if len(signature_a) == 0:
+        return 0.0
+    return sum(a == b for a, b in zip(signature_a, signature_b)) / len(signature_a)
+
+
+class MinHash:
+
+    def __init__(self, num_perm: int = 128, ngram: int = 5, seed: int = 1) -> None:
+        super().__init__()
+        assert num_perm > 0, 'num_perm should be positive'
+        self.num_perm = num_perm
+        self.ngram = ngram
+        self.seed = seed
+        rng = random.Random(seed)
+        self.a = [rng.randint(1, MERSENNE_PRIME - 1) for _ in range(num_perm)]
+        self.b = [rng.randint(0, MERSENNE_PRIME - 1) for _ in range(num_perm)]
+        if np is not None:
+            self._a = np.array(self.a, dtype=np.uint64)
+            self._b = np.array(self.b, dtype=np.uint64)
+
+    def hashes(self, text: str) -> list[int]:
+        return [hash32(shingle) for shingle in shingles(text, self.ngram)]
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        return self.signature_of_hashes(self.hashes(text))
+
+    def signature_of_hashes(self, hashes: list[int]) -> tuple[int, ...]:
+        if len(hashes) == 0:
+            return (MAX_HASH,) * self.num_perm
+        if np is not None:
+            hv = np.array(hashes, dtype=np.uint64)
+            permuted = (hv[:, None] * self._a + self._b) % np.uint64(MERSENNE_PRIME) & np.uint64(MAX_HASH)
+            return tuple(permuted.min(axis=0).tolist())
+        return tuple(
+            min(((a * h + b) & MASK_64) % MERSENNE_PRIME & MAX_HASH for h in hashes)
+            for a, b in zip(self.a, self.b)
+        )
+
+    def signatures(self, texts: list[str], batch_size: int = 256):
+        """
+        signatures of many texts, as `numpy.ndarray` of shape (n_texts, num_perm) if numpy installed, else list of tuples
+        """
+        if np is None:
+            return [self.signature(text) for text in texts]
+        results = np.full((len(texts), self.num_perm), MAX_HASH, dtype=np.uint64)
+        for start in range(0, len(texts), batch_size):
+            batch = [self.hashes(text) for text in texts[start:start + batch_size]]
+            rows = [i for i, hashes in enumerate(batch) if len(hashes) > 0]
+            if len(rows) == 0:
+                continue
+            offsets = np.cumsum([0] + [len(batch[i]) for i in rows[:-1]])
+            hv = np.fromiter((h for i in rows for h in batch[i]), dtype=np.uint64)
+            permuted = (hv[:, None] * self._a + self._b) % np.uint64(MERSENNE_PRIME) & np.uint64(MAX_HASH)
+            results[start + np.array(rows)] = np.minimum.reduceat(permuted, offsets, axis=0)
+        return results
+
+    def __getstate__(self):
+        return {'num_perm': self.num_perm, 'ngram': self.ngram, 'seed': self.seed}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+def _false_positive(threshold, bands, rows, steps=100):
+    step = threshold / steps
+    return sum(1 - (1 - (i * step) ** rows) ** bands for i in range(steps)) * step
+
+
+def _false_negative(threshold, bands, rows, steps=100):
+    step = (1 - threshold) / steps
+    return sum(1 - (1 - (1 - (threshold + i * step) ** rows) ** bands) for i in range(steps)) * step
+
+
+def optimal_bands(threshold: float, num_perm: int, weights: tuple[float, float] = (0.5, 0.5)) -> tuple[int, int]:
+    """
+    (bands, rows) minimizing the weighted false positive / false negative probability of the LSH banding
+    """
+    w_fp, w_fn = weights
+    best, best_error = (1, num_perm), float('inf')
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            error = w_fp * _false_positive(threshold, bands, rows) + w_fn * _false_negative(threshold, bands, rows)
+            if error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+
+    def __init__(self,
+                 threshold: float = 0.8,
+                 num_perm: int = 128,
+                 ngram: int = 5,
+                 seed: int = 1,
+                 bands: int | None = None,
+                 weights: tuple[float, float] = (0.5, 0.5)) -> None:
+        super().__init__()
+        assert 0 < threshold <= 1, 'threshold should be in (0, 1]'
+        self.threshold = threshold
+        self.minhash = MinHash(num_perm, ngram, seed)
+        if bands is None:
+            self.bands, self.rows = optimal_bands(threshold, num_perm, weights)
+        else:
+            assert 0 < bands <= num_perm, 'bands should be in (0, num_perm]'
+            self.bands, self.rows = bands, num_perm // bands
+        self.tables: list[dict[bytes, set]] = [defaultdict(set) for _ in range(self.bands)]
+        self.keys: dict = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def _signature(self, text, signature):
+        if signature is None:
+            signature = self.minhash.signature(text)
+        if len(signature) != self.minhash.num_perm:
+            raise ValueError(f"expecting signature of size {self.minhash.num_perm}, actual: {len(signature)}")
+        return signature
+
+    def _band_keys(self, signature) -> list[bytes]:
+        r = self.rows
+        return [struct.pack(f'<{r}I', *(int(v) for v in signature[i * r:(i + 1) * r])) for i in range(self.bands)]
+
+    def insert(self, key, text: str | None = None, signature=None):
+        if key in self.keys:
+            raise ValueError(f"key already exists: {key}")
+        band_keys = self._band_keys(self._signature(text, signature))
+        self.keys[key] = band_keys
+        for table, band_key in zip(self.tables, band_keys):
+            table[band_key].add(key)
+
+    def query(self, text: str | None = None, signature=None) -> list:
+        candidates = set()
+        for table, band_key in zip(self.tables, self._band_keys(self._signature(text, signature))):
+            candidates.update(table.get(band_key, ()))
+        return list(candidates)
+
+    def insert_unique(self, key, text: str | None = None, signature=None) -> list:
+        """
+        streaming dedup: returns the near-duplicates of the text, and only inserts it when there is none
+        """
+        signature = self._signature(text, signature)
+        duplicates = self.query(signature=signature)
+        if len(duplicates) == 0:
+            self.insert(key, signature=signature)
+        return duplicates
+
+    def remove(self, key):
+        band_keys = self.keys.pop(key, None)
+        if band_keys is None:
+            return
+        for table, band_key in zip(self.tables, band_keys):
+            bucket = table.get(band_key)
+            if bucket is None:
+                continue
+            bucket.discard(key)
+            if len(bucket) == 0:
+                del table[band_key]
+
+    def save(self, path: str):
+        _save(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'MinHashLSH':
+        return _load(cls, path)
+
+
+def simhash(text: str, ngram: int = 3, normalize: bool = True) -> int:
+    features = Counter(hash64(shingle) for shingle in _ngrams(text, ngram, normalize))
+    if len(features) == 0:
+        return 0
+    if np is not None:
+        return _simhash_np(np.fromiter(features.keys(), dtype=np.uint64), np.fromiter(features.values(), dtype=np.int64))
+    weights = [0] * 64
+    for h, count in features.items():
+        for i in range(64):
+            weights[i] += count if h >> i & 1 else -count
+    return sum(1 << i for i, w in enumerate(weights) if w > 0)
+
+
+def simhashes(texts: list[str], ngram: int = 3, normalize: bool = True):
+    """
+    fingerprints of many texts, as `numpy.ndarray` of uint64 if numpy installed, else list of ints
+    """
+    if np is None:
+        return [simhash(text, ngram, normalize) for text in texts]
+    return np.array([simhash(text, ngram, normalize) for text in texts], dtype=np.uint64)
+
+
+def _ngrams(text, ngram, normalize):
+    if normalize:
+        text = canonicalize(text)
+    if not text:
+        return []
+    if len(text) <= ngram:
+        return [text]
+    return [text[i:i + ngram] for i in range(len(text) - ngram + 1)]
+
+
+def _simhash_np(hashes, counts) -> int:
+    bits = (hashes[:, None] >> np.arange(64, dtype=np.uint64)) & np.uint64(1)
+    weights = ((bits.astype(np.int64) * 2 - 1) * counts[:, None]).sum(axis=0)
+    return sum(1 << int(i) for i in np.nonzero(weights > 0)[0])
+
+
+class SimHashIndex:
+
+    def __init__(self, distance: int = 3, ngram: int = 3) -> None:
+        super().__init__()
+        assert 0 <= distance < 64, 'distance should be in [0, 64)'
+        self.distance = distance
+        self.ngram = ngram
+        n_blocks = distance + 1
+        size, remainder = divmod(64, n_blocks)
+        self.blocks: list[tuple[int, int]] = []
+        offset = 0
+        for i in range(n_blocks):
+            width = size + (1 if i < remainder else 0)
+            self.blocks.append((offset, (1 << width) - 1))
+            offset += width
+        self.tables: list[dict[int, set]] = [defaultdict(set) for _ in range(n_blocks)]
+        self.fingerprints: dict = {}
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def __contains__(self, key):
+        return key in self.fingerprints
+
+    def _fingerprint(self, text, fingerprint):
+        return int(fingerprint) if fingerprint is not None else simhash(text, self.ngram)
+
+    def _block_keys(self, fingerprint: int) -> list[int]:
+        return [fingerprint >> offset & mask for offset, mask in self.blocks]
+
+    def insert(self, key, text: str | None = None, fingerprint: int | None = None):
+        if key in self.fingerprints:
+            raise ValueError(f"key already exists: {key}")
+        fingerprint = self._fingerprint(text, fingerprint)
+        self.fingerprints[key] = fingerprint
+        for table, block_key in zip(self.tables, self._block_keys(fingerprint)):
+            table[block_key].add(key)
+
+    def query(self, text: str | None = None, fingerprint: int | None = None) -> list:
+        fingerprint = self._fingerprint(text, fingerprint)
+        candidates = set()
+        for table, block_key in zip(self.tables, self._block_keys(fingerprint)):
+            candidates.update(table.get(block_key, ()))
+        return [key for key in candidates if hamming(self.fingerprints[key], fingerprint) <= self.distance]
+
+    def insert_unique(self, key, text: str | None = None, fingerprint: int | None = None) -> list:
+        """
+        streaming dedup: returns the near-duplicates of the text, and only inserts it when there is none
+        """
+        fingerprint = self._fingerprint(text, fingerprint)
+        duplicates = self.query(fingerprint=fingerprint)
+        if len(duplicates) == 0:
+            self.insert(key, fingerprint=fingerprint)
+        return duplicates
+
+    def remove(self, key):
+        fingerprint = self.fingerprints.pop(key, None)
+        if fingerprint is None:
+            return
+        for table, block_key in zip(self.tables, self._block_keys(fingerprint)):
+            bucket = table.get(block_key)
+            if bucket is None:
+                continue
+            bucket.discard(key)
+            if len(bucket) == 0:
+                del table[block_key]
+
+    def save(self, path: str):
+        _save(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'SimHashIndex':
+        return _load(cls, path)
+
+
+def _save(index, path: str):
+    path = paths.get(path)
+    paths.make_parent_dirs(path)
+    with open(path, 'wb') as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load(cls, path: str):
+    with open(paths.get(path), 'rb') as f:
+        index = pickle.load(f)
+    if not isinstance(index, cls):
+        raise ValueError(f"expecting {cls.__name__} in {path}, actual: {type(index).__name__}")
+    return index
@@ -26,8 +26,15 @@ for word in tqdm.tqdm(words_all):
         transitions[c].add(chunk)
 NAIVE_NEG_CHAR_TRANSITION = {c: chars2 - followings for c, followings in transitions.items()}
 """
+import string
+
 from . import strings
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 NAIVE_NEG_CHAR_TRANSITION = {
     'a': {
@@ -476,7 +483,89 @@ NAIVE_NEG_CHAR_TRANSITION = {
 }
 
 
+# a-z / A-Z to 0..25, for indexing the transition table
+_CODES = bytes.maketrans(
+    (string.ascii_lowercase + string.ascii_uppercase).encode(),
+    bytes(range(26)) * 2,
+)
+_NEG_TABLE = None
+_NEG_TABLE_NP = None
+
+
+def _neg_table() -> bytes:
+    """
+    `NAIVE_NEG_CHAR_TRANSITION` compiled into a 26 x 676 table, indexed by `c * 676 + chunk[0] * 26 + chunk[1]`,
+    1 for a negative transition
+    """
+    global _NEG_TABLE
+    if _NEG_TABLE is None:
+        table = bytearray(b'\x01' * 26 * 676)
+        for i, c in enumerate(string.ascii_lowercase):
+            negatives = NAIVE_NEG_CHAR_TRANSITION.get(c)
+            if negatives is None:
+                continue
+            table[i * 676: (i + 1) * 676] = bytes(676)
+            for chunk in negatives:
+                table[i * 676 + (ord(chunk[0]) - 97) * 26 + ord(chunk[1]) - 97] = 1
+        _NEG_TABLE = bytes(table)
+    return _NEG_TABLE
+
+
 def is_valid_word_naive(text: str):
+    if text is None:
+        return False
+    size = len(text)
+    if size <= 3:
+        return size == 0 or text.isalpha()
+    if not text.isascii():
+        return _is_valid_word_naive(text)
+    if not text.isalpha():
+        return False
+    table = _neg_table()
+    codes = text.encode('ascii').translate(_CODES)
+    for i in range(size - 3):
+        if table[codes[i] * 676 + codes[i + 1] * 26 + codes[i + 2]]:
+            return False
+    return True
+
+
+def is_valid_word_naive_many(texts: list[str]) -> list[bool]:
+    """
+    `is_valid_word_naive` over many tokens, vectorized with numpy if installed
+    """
+    if texts is None:
+        return None
+    if np is None:
+        return [is_valid_word_naive(text) for text in texts]
+
+    global _NEG_TABLE_NP
+    if _NEG_TABLE_NP is None:
+        _NEG_TABLE_NP = np.frombuffer(_neg_table(), dtype=np.uint8).astype(bool)
+
+    results = [False] * len(texts)
+    indices, words = [], []
+    for i, text in enumerate(texts):
+        if text is not None and len(text) > 3 and text.isascii():
+            if text.isalpha():
+                indices.append(i)
+                words.append(text)
+        else:
+            results[i] = is_valid_word_naive(text)
+    if len(words) == 0:
+        return results
+
+    codes = np.frombuffer(''.join(words).encode('ascii').translate(_CODES), dtype=np.uint8).astype(np.intp)
+    negatives = _NEG_TABLE_NP[codes[:-2] * 676 + codes[1:-1] * 26 + codes[2:]]
+    counts = np.concatenate(([0], np.cumsum(negatives, dtype=np.int64)))
+    lengths = np.fromiter(map(len, words), dtype=np.intp, count=len(words))
+    starts = np.cumsum(lengths) - lengths
+    valid = counts[starts + lengths - 3] == counts[starts]
+    for i, ok in zip(indices, valid.tolist()):
+        results[i] = ok
+    return results
+
+
+def _is_valid_word_naive(text: str):
     if text is None:
         return False
     size = len(text)
@@ -48,6 +48,9 @@ items = es.search(query, index='optional-index', size=200)
 # scrolls
 items_generator = es.search(query, index='optional-index', size=200, scroll='10m')
 
+# search_after over a point in time, next page prefetched
+items_generator = es.iterate(query, index='optional-index', page_size=1000, source=['title', 'date'])
+
 es.delete_by_query(query, index='optional-index', timeout=600)
 
 es.delete_by_id(id, index='optional-index')
@@ -55,6 +58,7 @@ es.delete_by_id(id, index='optional-index')
 es.bulk(actions)
 """
 import html
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 
 from elasticsearch import Elasticsearch, NotFoundError, helpers
@@ -198,6 +202,76 @@ class ES:
             except Exception:
                 pass
 
+    def iterate(self,
+                query: dict,
+                index: str,
+                page_size: int = 1000,
+                pit: bool = True,
+                source: list[str] | bool | None = None,
+                keep_alive: str = '1m',
+                tiebreaker: str = '_id',
+                timeout=60,
+                **params):
+        """
+        All hits of the query, paged by `search_after`, each page fetched in a background thread
+        while the previous one is consumed; no scroll context kept on the cluster.
+        :param pit: over a point in time, a consistent view of the index, sorted by `_shard_doc` unless `sort` in query
+        :param source: `_source` fields to return, or False for none, set in the request
+        :param keep_alive: of the point in time, between two pages
+        :param tiebreaker: without `pit`, unique field appended to the sort, to page without duplicates or misses
+        """
+        assert query is not None and len(query) > 0, 'query required, and should not be empty'
+        assert index is not None, 'index required'
+
+        body = query.copy()
+        for name in ['from', 'size', 'scroll', 'highlight', 'search_after', 'pit']:
+            body.pop(name, None)
+        body['size'] = page_size
+        body['track_total_hits'] = False
+        if source is not None:
+            body['_source'] = source
+        sort = body.get('sort')
+        sort = list(sort) if isinstance(sort, list) else [sort] if sort else []
+
+        pit_id = None
+        if pit:
+            pit_id = self.client.open_point_in_time(index=index, keep_alive=keep_alive)['id']
+            body['sort'] = sort or [{'_shard_doc': 'asc'}]
+        else:
+            if not any(tiebreaker in (s if isinstance(s, dict) else {s: None}) for s in sort):
+                sort.append({tiebreaker: 'asc'})
+            body['sort'] = sort
+
+        def fetch(search_after):
+            page = dict(body)
+            if search_after is not None:
+                page['search_after'] = search_after
+            if pit_id is None:
+                return self.client.search(index=index, body=page, request_timeout=timeout, params=params)
+            page['pit'] = {'id': pit_id, 'keep_alive': keep_alive}
+            return self.client.search(body=page, request_timeout=timeout, params=params)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(fetch, None)
+        try:
+            while future is not None:
+                data = future.result()
+                if pit:
+                    # may change between pages
+                    pit_id = data.get('pit_id', pit_id)
+                hits = data['hits']['hits']
+                future = executor.submit(fetch, hits[-1]['sort']) if len(hits) == page_size else None
+                yield from hits
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=True)
+            if pit_id is not None:
+                try:
+                    self.client.close_point_in_time(body={'id': pit_id}, ignore=(404,))
+                except Exception:
+                    pass
+
     @staticmethod
     def _html_escape(item: dict, pre_tags: list[str], post_tags: list[str]):
         def convert(text):
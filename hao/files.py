@@ -1,114 +1,568 @@
 # -*- coding: utf-8 -*-
+import argparse
 import base64
+import functools
 import hashlib
+import itertools
 import logging
 import math
 import mmap
 import os
-import sys
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from typing import Pattern
 
 import regex
 
+from . import paths
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 LOGGER = logging.getLogger(__name__)
 
 P_BLANK_LINE = regex.compile(r'^(?:\s|\r|\n)*$')
+# `P_BLANK_LINE` on utf-8 bytes, without decoding: blank lines after a newline, and the first line of a chunk;
+# whitespaces except newline, the ascii ones and the utf-8 encoded others
+_P_WHITESPACES_BYTES = rb'(?:[\t\x0b\x0c\r ]|' + b'|'.join([
+    regex.escape(c.encode())
+    for c in '\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000'
+]) + rb')*'
+P_BLANK_LINE_BYTES = regex.compile(rb'\n(?=[\t\x0b\x0c\r \n\xc2\xe1\xe2\xe3]|\Z)' + _P_WHITESPACES_BYTES + rb'(?=\n|\Z)')
+P_BLANK_HEAD_BYTES = regex.compile(_P_WHITESPACES_BYTES + rb'(?:\n|\Z)')
 
+CHUNK_SIZE = 8 * 1024 * 1024
+RANGE_SIZE = 64 * 1024 * 1024
+CHECKSUM_CACHE_PATH = '~/.cache/hao/checksums.db'
 
-def count_lines(file: str):
-    with open(file, "r+") as f:
-        n_lines = 0
-        try:
-            buf = mmap.mmap(f.fileno(), 0)
-            while buf.readline():
-                n_lines += 1
-        except ValueError:
-            pass  # cannot mmap an empty file
-        return n_lines
+
+def count_lines(file: str, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    """
+    number of lines, counted in place over a read-only mmap, the last line counted even without the trailing newline
+    :param workers: number of threads counting newline-aligned byte ranges concurrently
+    :param chunk_size: bytes compared at a time, when counted with numpy
+    """
+    ranges = _line_ranges(file, workers)
+    count_range = functools.partial(_count_lines, file, chunk_size=chunk_size)
+    if len(ranges) <= 1:
+        return sum([count_range(start, end) for start, end in ranges])
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(lambda r: count_range(*r), ranges))
 
 
-def count_blank_lines(file):
-    return count_matched_lines(file, P_BLANK_LINE)
+def count_blank_lines(file, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    """
+    number of lines containing only whitespaces, matched on utf-8 bytes, without decoding the lines
+    """
+    return _count(file, _count_blank_lines, workers, chunk_size)
 
 
-def count_matched_lines(file: str, p: Pattern):
+def count_matched_lines(file: str, p: Pattern, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    """
+    number of lines `p.search(line)` matches, the line includes its trailing newline; decoded by chunks
+    """
     if isinstance(p, str):
         p = regex.compile(p)
-    with open(file, "r+") as f:
+    return _count(file, functools.partial(_count_matched_lines, p=p), workers, chunk_size)
+
+
+def parallel_map_lines(file: str,
+                       fn: Callable[[str], object],
+                       workers: int | None = None,
+                       ordered: bool = True,
+                       range_size: int = RANGE_SIZE,
+                       encoding: str = 'utf-8') -> Generator[object, None, None]:
+    """
+    `fn(line)` for every line (without the trailing newline), in a process pool over newline-aligned byte ranges,
+    each read through mmap; results streamed back per range, at most `2 * workers` ranges in flight.
+    :param fn: picklable, e.g. a module-level function
+    :param workers: number of processes, default to cpu count, 1 to run in the current process
+    :param ordered: results in line order, otherwise in range completion order (still in order within a range)
+    :param range_size: approximate bytes per range
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(file)
+    ranges = _line_ranges(file, max(workers, math.ceil(size / range_size)))
+    if workers == 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            yield from _map_range(file, start, end, fn, encoding)
+        return
+
+    ranges = iter(ranges)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit(n: int):
+            for start, end in itertools.islice(ranges, n):
+                pending.append(executor.submit(_map_range, file, start, end, fn, encoding))
+
+        pending = deque()
+        submit(2 * workers)
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = next(iter(done))
+                pending.remove(future)
+            yield from future.result()
+            submit(1)
+
+
+def _map_range(file: str, start: int, end: int, fn: Callable[[str], object], encoding: str) -> list:
+    results = []
+    with (open(file, 'rb') as f,
+          mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+          memoryview(buffer) as view):
+        find = buffer.find
+        i = start
+        while i < end:
+            j = find(b'\n', i, end)
+            if j < 0:
+                j = end
+            results.append(fn(str(view[i:j], encoding)))
+            i = j + 1
+    return results
+
+
+def _count_lines(file: str, start: int, end: int, chunk_size: int = CHUNK_SIZE):
+    with (open(file, 'rb') as f,
+          mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer):
+        n_lines = buffer[end - 1] != 10
+        if hasattr(buffer, 'count'):
+            return n_lines + buffer.count(b'\n', start, end)
+        # numpy compares every byte, `readline` jumps with memchr, faster only for long lines, estimated from the head
+        probe = min(start + 64 * 1024, end)
+        if np is not None and buffer[start:probe].count(b'\n') * 512 >= probe - start:
+            data = np.frombuffer(buffer, dtype=np.uint8)
+            n_lines += sum([int(np.count_nonzero(data[i:min(i + chunk_size, end)] == 10)) for i in range(start, end, chunk_size)])
+            del data  # the mmap can't close while exported
+            return n_lines
+        buffer.seek(start)
+        readline, tell = buffer.readline, buffer.tell
         n_lines = 0
-        try:
-            buf = mmap.mmap(f.fileno(), 0)
-            while True:
-                line = buf.readline()
-                if line is None or len(line) == 0:
-                    break
-                if p.search(line.decode()) is not None:
-                    n_lines += 1
-        except ValueError:
-            pass  # cannot mmap an empty file
+        while tell() < end:
+            readline()
+            n_lines += 1
         return n_lines
 
 
-def checksum(filename, algorithm='md5', hexical: bool = True, block_size=64 * 1024):
+def _count_blank_lines(buffer: bytearray, start: int, end: int):
+    # blank lines after a newline, minus the one matched at the end of a chunk after its final newline, plus the first
+    n_lines = len(P_BLANK_LINE_BYTES.findall(buffer, start, end)) - (buffer[end - 1] == 10)
+    return n_lines + (P_BLANK_HEAD_BYTES.match(buffer, start, end) is not None)
+
+
+def _count_matched_lines(buffer: bytearray, start: int, end: int, p: Pattern):
+    with memoryview(buffer) as view:
+        lines = str(view[start:end], 'utf-8').split('\n')
+    n_lines = sum([p.search(f"{line}\n") is not None for line in lines[:-1]])
+    if lines[-1]:
+        n_lines += p.search(lines[-1]) is not None
+    return n_lines
+
+
+def _count(file: str, fn: Callable[[bytearray, int, int], int], workers: int, chunk_size: int):
+    ranges = _line_ranges(file, workers)
+    count_range = functools.partial(_count_range, file, fn=fn, chunk_size=chunk_size)
+    if len(ranges) <= 1:
+        return sum([count_range(start, end) for start, end in ranges])
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(lambda r: count_range(*r), ranges))
+
+
+def _count_range(file: str, start: int, end: int, fn: Callable[[bytearray, int, int], int], chunk_size: int):
+    return sum([fn(*chunk) for chunk in _iter_line_chunks(file, start, end, chunk_size)])
+
+
+def _iter_line_chunks(file: str,
+                      start: int,
+                      end: int,
+                      chunk_size: int = CHUNK_SIZE) -> Generator[tuple[bytearray, int, int], None, None]:
+    """
+    chunks of whole lines in byte range [start, end), as `(buffer, start, end)` of one reused buffer, read with `readinto`,
+    only the last one may go without the trailing newline
+    """
+    buffer = bytearray(chunk_size)
+    with open(file, 'rb', buffering=0) as f:
+        f.seek(start)
+        remaining = end - start
+        n_carry = 0
+        while remaining > 0:
+            if n_carry == len(buffer):
+                buffer.extend(bytes(len(buffer)))  # a line longer than the buffer
+            with memoryview(buffer) as view:
+                n = f.readinto(view[n_carry:n_carry + min(len(buffer) - n_carry, remaining)])
+            if not n:
+                break
+            remaining -= n
+            size = n_carry + n
+            i = buffer.rfind(b'\n', n_carry, size)
+            if i < 0:
+                n_carry = size
+                continue
+            yield buffer, 0, i + 1
+            n_carry = size - i - 1
+            buffer[:n_carry] = buffer[i + 1:size]
+        if n_carry:
+            yield buffer, 0, n_carry
+
+
+def _line_ranges(file: str, n_ranges: int) -> list[tuple[int, int]]:
+    """
+    splits the file into at most `n_ranges` byte ranges of about the same size, each starting at a line start
+    """
+    size = os.path.getsize(file)
+    if size == 0:
+        return []
+    offsets = [0]
+    with open(file, 'rb') as f:
+        for i in range(1, max(n_ranges, 1)):
+            offset = _next_line_start(f, max(size * i // n_ranges, offsets[-1]), size)
+            if offset >= size:
+                break
+            if offset > offsets[-1]:
+                offsets.append(offset)
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def _next_line_start(f, offset: int, size: int, block_size: int = 64 * 1024):
+    """
+    the first line start at or after `offset`, i.e. `offset` itself if preceded by a newline
+    """
+    if offset <= 0:
+        return 0
+    f.seek(offset - 1)
+    while True:
+        data = f.read(block_size)
+        if not data:
+            break
+        i = data.find(b'\n')
+        if i >= 0:
+            return offset + i
+        offset += len(data)
+    return size
+
+
+def checksum(filename, algorithm='md5', hexical: bool = True, block_size=64 * 1024, cache: bool = False):
+    """
+    :param cache: look up / save in the persistent `ChecksumCache`, returns instantly for unchanged files
+    """
+    digests = checksums(filename, [algorithm], hexical=hexical, block_size=block_size, cache=cache)
+    return None if digests is None else digests[algorithm]
+
+
+def checksums(filename,
+              algorithms: Iterable[str] = ('md5', 'sha256'),
+              hexical: bool = True,
+              block_size: int = 1024 * 1024,
+              cache: bool = False) -> dict[str, str] | None:
+    """
+    all the digests in one read, each block fed to every digest
+    :param cache: look up / save in the persistent `ChecksumCache`, only the missing digests computed
+    :return: {algorithm: digest}, None if the file not exists
+    """
     if not os.path.exists(filename):
         return None
-    with open(filename, 'rb') as f:
-        digest = getattr(hashlib, algorithm)()
-        while True:
-            data = f.read(block_size)
-            if not data:
-                break
-            digest.update(data)
+    algorithms = list(algorithms)
+    if cache:
+        digests = checksum_cache().get_or_compute(
+            filename,
+            algorithms,
+            lambda missing: checksums(filename, missing, block_size=block_size),
+        )
+    else:
+        digests = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+        buffer = bytearray(block_size)
+        with open(filename, 'rb', buffering=0) as f, memoryview(buffer) as view:
+            while n := f.readinto(buffer):
+                for digest in digests.values():
+                    digest.update(view[:n])
+        digests = {algorithm: digest.hexdigest() for algorithm, digest in digests.items()}
 
     if hexical:
-        return digest.hexdigest()
+        return digests
     else:
-        return base64.b64encode(digest.digest()).decode()
+        return {algorithm: base64.b64encode(bytes.fromhex(digest)).decode() for algorithm, digest in digests.items()}
+
+
+def checksum_tree(directory: str,
+                  algorithms: str | list[str] = 'md5',
+                  hexical: bool = True,
+                  workers: int | None = None,
+                  block_size: int = 1024 * 1024) -> dict[str, str | dict[str, str]]:
+    """
+    checksums of all files under the directory, hashed concurrently in a thread pool (hashlib releases the GIL)
+    :param algorithms: one algorithm for `{path: digest}`, or a list of them for `{path: {algorithm: digest}}`
+    :param workers: number of threads, default to cpu count
+    :return: keyed by paths relative to the directory, sorted
+    """
+    filenames = sorted(
+        os.path.relpath(os.path.join(root, name), directory)
+        for root, _, names in os.walk(directory)
+        for name in names
+    )
+    single = isinstance(algorithms, str)
+    hash_file = functools.partial(
+        checksums,
+        algorithms=[algorithms] if single else algorithms,
+        hexical=hexical,
+        block_size=block_size,
+    )
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(hash_file, [os.path.join(directory, filename) for filename in filenames])
+        return {
+            filename: digests[algorithms] if single else digests
+            for filename, digests in zip(filenames, results)
+            if digests is not None
+        }
+
+
+class ChecksumCache:
+    """
+    Persistent checksums in sqlite, keyed by (device, inode, algorithm), valid while the mtime and size unchanged.
+    Stale entries are replaced when found, `evict` removes the unused and the ones of deleted / changed files.
+    """
+
+    def __init__(self, path: str = CHECKSUM_CACHE_PATH, timeout: int = 30) -> None:
+        super().__init__()
+        self.path = paths.get(path)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            paths.make_parent_dirs(self.path)
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS checksums ('
+                'device INTEGER, inode INTEGER, algorithm TEXT, mtime INTEGER, size INTEGER, value TEXT, path TEXT, '
+                'accessed INTEGER, PRIMARY KEY (device, inode, algorithm))'
+            )
+            self._local.conn = conn
+        return conn
+
+    def get(self, filename: str, algorithm: str, stat: os.stat_result | None = None) -> str | None:
+        stat = stat or os.stat(filename)
+        conn = self._conn()
+        key = (stat.st_dev, stat.st_ino, algorithm)
+        row = conn.execute(
+            'SELECT mtime, size, value, accessed FROM checksums WHERE device = ? AND inode = ? AND algorithm = ?', key
+        ).fetchone()
+        if row is None:
+            return None
+        mtime, size, value, accessed = row
+        if mtime != stat.st_mtime_ns or size != stat.st_size:
+            conn.execute('DELETE FROM checksums WHERE device = ? AND inode = ? AND algorithm = ?', key)
+            return None
+        now = int(time.time())
+        if now - accessed > 86400:
+            conn.execute('UPDATE checksums SET accessed = ? WHERE device = ? AND inode = ? AND algorithm = ?', (now, *key))
+        return value
+
+    def put(self, filename: str, algorithm: str, value: str, stat: os.stat_result | None = None):
+        stat = stat or os.stat(filename)
+        self._conn().execute(
+            'INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (stat.st_dev, stat.st_ino, algorithm, stat.st_mtime_ns, stat.st_size, value,
+             os.path.abspath(filename), int(time.time())),
+        )
+
+    def get_or_compute(self,
+                       filename: str,
+                       algorithms: list[str],
+                       compute: Callable[[list[str]], dict[str, str]]) -> dict[str, str]:
+        """
+        :param compute: computes the digests of the missing algorithms, saved only if the file unchanged meanwhile
+        """
+        stat = os.stat(filename)
+        digests = {algorithm: self.get(filename, algorithm, stat) for algorithm in algorithms}
+        missing = [algorithm for algorithm, digest in digests.items() if digest is None]
+        if len(missing) == 0:
+            return digests
+        computed = compute(missing)
+        digests.update(computed)
+        after = os.stat(filename)
+        if (after.st_mtime_ns, after.st_size, after.st_ino) == (stat.st_mtime_ns, stat.st_size, stat.st_ino):
+            for algorithm, digest in computed.items():
+                self.put(filename, algorithm, digest, stat)
+        return digests
+
+    def evict(self, max_age: int | None = 90 * 86400, check_files: bool = True) -> int:
+        """
+        :param max_age: removes entries not accessed in `max_age` seconds
+        :param check_files: removes entries of files deleted or changed
+        :return: number of entries removed
+        """
+        conn = self._conn()
+        n_removed = 0
+        if max_age is not None:
+            n_removed += conn.execute('DELETE FROM checksums WHERE accessed < ?', (int(time.time()) - max_age,)).rowcount
+        if check_files:
+            stale = []
+            for device, inode, algorithm, mtime, size, path in conn.execute(
+                'SELECT device, inode, algorithm, mtime, size, path FROM checksums'
+            ).fetchall():
+                try:
+                    stat = os.stat(path)
+                    if (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size) == (device, inode, mtime, size):
+                        continue
+                except OSError:
+                    pass
+                stale.append((device, inode, algorithm))
+            conn.executemany('DELETE FROM checksums WHERE device = ? AND inode = ? AND algorithm = ?', stale)
+            n_removed += len(stale)
+        return n_removed
+
+    def clear(self):
+        self._conn().execute('DELETE FROM checksums')
+
+
+_CHECKSUM_CACHE = None
+_LOCK = threading.Lock()
+
 
+def checksum_cache() -> ChecksumCache:
+    global _CHECKSUM_CACHE
+    if _CHECKSUM_CACHE is None:
+        with _LOCK:
+            if _CHECKSUM_CACHE is None:
+                _CHECKSUM_CACHE = ChecksumCache()
+    return _CHECKSUM_CACHE
 
-def md5(filename, hexical: bool = True, block_size=64 * 1024):
-    return checksum(filename, algorithm='md5', hexical=hexical, block_size=block_size)
 
+def md5(filename, hexical: bool = True, block_size=64 * 1024, cache: bool = False):
+    return checksum(filename, algorithm='md5', hexical=hexical, block_size=block_size, cache=cache)
 
-def sha1(filename, hexical: bool = True, block_size=64 * 1024):
-    return checksum(filename, algorithm='sha1', hexical=hexical, block_size=block_size)
 
+def sha1(filename, hexical: bool = True, block_size=64 * 1024, cache: bool = False):
+    return checksum(filename, algorithm='sha1', hexical=hexical, block_size=block_size, cache=cache)
 
-def sha256(filename, hexical: bool = True, block_size=64 * 1024):
-    return checksum(filename, algorithm='sha256', hexical=hexical, block_size=block_size)
 
+def sha256(filename, hexical: bool = True, block_size=64 * 1024, cache: bool = False):
+    return checksum(filename, algorithm='sha256', hexical=hexical, block_size=block_size, cache=cache)
 
-def split(filename, n_split: int, split_prefix: str = '-split-'):
+
+def split(filename,
+          n_split: int | None = None,
+          split_prefix: str = '-split-',
+          size: int | None = None,
+          lines: int | None = None,
+          workers: int = 1) -> list[str]:
+    """
+    Splits the file at line boundaries into `{prefix}{split_prefix}{i}{suffix}`, by one of:
+        - n_split: number of parts of about the same size in bytes
+        - size: about `size` bytes per part, cut at the next line start
+        - lines: `lines` lines per part
+    without decoding, parts copied in binary with `copy_file_range` / `sendfile` where available
+    :param workers: number of threads writing parts concurrently
+    :return: paths of the parts
+    """
     assert os.path.exists(filename), f"File not exist: {filename}"
-    assert n_split > 1, 'n_split should be larger than 1'
+    assert sum(x is not None for x in (n_split, size, lines)) == 1, 'expecting exactly one of n_split, size, lines'
+    assert n_split is None or n_split > 1, 'n_split should be larger than 1'
+    assert size is None or size > 0, 'size should be positive'
+    assert lines is None or lines > 0, 'lines should be positive'
 
-    lines_per_split = math.ceil(count_lines(filename) / n_split)
+    file_size = os.path.getsize(filename)
+    if lines is not None:
+        ranges = _line_count_ranges(filename, lines)
+    else:
+        ranges = _line_ranges(filename, n_split or math.ceil(file_size / size))
     prefix, suffix = os.path.splitext(filename)
-    i = 0
-    LOGGER.info(f"Spliting {filename} into {n_split}, {lines_per_split} lines each")
-    with open(filename) as f_in:
-        f_out = open(f"{prefix}{split_prefix}{i}{suffix}", 'w')
-        n_lines = 0
-        for line in f_in:
-            f_out.write(line)
-            n_lines += 1
-            if n_lines >= lines_per_split:
-                f_out.close()
-                i += 1
-                f_out = open(f"{prefix}{split_prefix}{i}{suffix}", 'w')
-                n_lines = 0
-        f_out.close()
+    parts = [f"{prefix}{split_prefix}{i}{suffix}" for i in range(len(ranges))]
+    LOGGER.info(f"Spliting {filename} into {len(parts)}")
+    if workers <= 1 or len(parts) <= 1:
+        for part, (start, end) in zip(parts, ranges):
+            _copy_range(filename, part, start, end)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_copy_range, filename, part, start, end) for part, (start, end) in zip(parts, ranges)]
+            for future in futures:
+                future.result()
+    return parts
+
+
+def _line_count_ranges(file: str, lines: int, chunk_size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """
+    byte ranges of `lines` lines each, newlines counted by chunks, located by `find` only in chunks with a cut
+    """
+    offsets = [0]
+    remaining, pos = lines, 0
+    buffer = bytearray(chunk_size)
+    with open(file, 'rb', buffering=0) as f:
+        while n := f.readinto(buffer):
+            count, i = buffer.count(b'\n', 0, n), 0
+            while count >= remaining:
+                for _ in range(remaining):
+                    i = buffer.find(b'\n', i, n) + 1
+                offsets.append(pos + i)
+                count -= remaining
+                remaining = lines
+            remaining -= count
+            pos += n
+    if offsets[-1] < pos:
+        offsets.append(pos)
+    return list(zip(offsets, offsets[1:]))
+
+
+def _copy_range(src: str, dst: str, start: int, end: int, block_size: int = CHUNK_SIZE):
+    with open(src, 'rb') as f_in, open(dst, 'wb') as f_out:
+        fd_in, fd_out = f_in.fileno(), f_out.fileno()
+        offset = start
+        methods = [
+            lambda count: os.copy_file_range(fd_in, fd_out, count, offset),
+            lambda count: os.sendfile(fd_out, fd_in, offset, count),
+        ]
+        while offset < end and methods:
+            try:
+                n = methods[0](min(end - offset, 1 << 30))
+            except (AttributeError, OSError):
+                methods.pop(0)  # not supported by the platform / file system
+                continue
+            if n == 0:
+                break
+            offset += n
+        f_in.seek(offset)
+        while offset < end:
+            data = f_in.read(min(block_size, end - offset))
+            if not data:
+                break
+            f_out.write(data)
+            offset += len(data)
 
 
 def split_cli():
-    args = sys.argv
-    if len(args) not in (3, 4):
-        LOGGER.warn('Usage: h-split path/to/file {n_split} [optional_split_prefix]')
-        return
-    filename = args[1]
-    n_split = int(args[2])
-    if len(args) == 4:
-        split_prefix = args[3]
-        split(filename, n_split, split_prefix)
-    else:
-        split(filename, n_split)
+    parser = argparse.ArgumentParser(prog='h-split', description='split a file at line boundaries')
+    parser.add_argument('file')
+    parser.add_argument('n_split', nargs='?', type=int, help='number of parts of about the same size')
+    parser.add_argument('split_prefix', nargs='?', default='-split-')
+    parser.add_argument('--size', type=_parse_size, help='bytes per part, e.g. 512M, 2G')
+    parser.add_argument('--lines', type=int, help='lines per part')
+    parser.add_argument('--workers', type=int, default=1, help='number of threads writing parts concurrently')
+    args, unknown = parser.parse_known_args()
+    # split prefix like `-split-` is taken as an unknown option by argparse
+    if len(unknown) == 1 and args.split_prefix == '-split-' and args.n_split is not None:
+        args.split_prefix = unknown.pop()
+    if len(unknown) > 0:
+        parser.error(f"unrecognized arguments: {' '.join(unknown)}")
+    if sum(x is not None for x in (args.n_split, args.size, args.lines)) != 1:
+        parser.error('expecting exactly one of n_split, --size, --lines')
+    split(args.file, args.n_split, args.split_prefix, size=args.size, lines=args.lines, workers=args.workers)
+
+
+def _parse_size(size: str) -> int:
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+    size = size.strip().upper().removesuffix('B')
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
@@ -169,7 +169,7 @@ class Loggers:
                 _logger.addHandler(handler)
 
         if level:
-            self._loggers_config[name]['level'] = level
+            self._loggers_config.setdefault(name, {})['level'] = level
 
         return _logger
 
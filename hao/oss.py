@@ -6,22 +6,29 @@
 pip install oss2
 """
 import configparser
+import functools
 import logging
 import os
-import random
 import sys
+import threading
 from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import oss2
 import requests
-from tqdm import tqdm
 
-from . import logs, paths, regexes
+from . import crc64, files, logs, paths, regexes, transfers
 from .config import Config, get_config
 from .stopwatch import Stopwatch
+from .transfers import SyncResult, TransferProgress
 
 LOGGER = logs.get_logger(__name__, level=logging.INFO)
 
+PART_SIZE = 8 * 1024 * 1024
+# objects per page of listings, the maximum allowed, oss2 defaults to 100
+MAX_KEYS = 1000
+
 P_IGNORED = regexes.re_compile([
     r'\.DS_Store',
     r'Thumbs\.db',
@@ -29,22 +36,34 @@ P_IGNORED = regexes.re_compile([
 ])
 
 
-class ProgressBar(object):
-
-    def __init__(self, bar: tqdm, consumed=0) -> None:
-        super().__init__()
-        self.bar = bar
-        self.consumed = consumed
-
-
 class OSS(object):
 
-    def __init__(self, access_id: str, access_secret: str, endpoint: str = 'http://oss-cn-beijing.aliyuncs.com') -> None:
+    def __init__(self,
+                 access_id: str,
+                 access_secret: str,
+                 endpoint: str = 'http://oss-cn-beijing.aliyuncs.com',
+                 *,
+                 part_size: int = PART_SIZE,
+                 part_threads: int = 4,
+                 concurrency: int = 16,
+                 pool_size: int | None = None) -> None:
+        """
+        :param part_size: files larger than it are transferred in parts of it
+        :param part_threads: threads per file transferring parts, in directory transfers
+        :param concurrency: budget of concurrent requests, shared by file workers x part threads
+        :param pool_size: connections kept per host in the session shared by all buckets, default to `concurrency`
+        """
         super().__init__()
         self.access_id = access_id
         self.access_secret = access_secret
         self.endpoint = endpoint
-        self.progress_bars = {}
+        self.part_size = part_size
+        self.part_threads = part_threads
+        self.concurrency = concurrency
+        self.pool_size = pool_size or concurrency
+        self._session = None
+        self._buckets: dict[str, oss2.Bucket] = {}
+        self._lock = threading.Lock()
 
     @classmethod
     def from_ossutilconfig(cls):
@@ -70,8 +89,23 @@ class OSS(object):
         return oss2.Auth(self.access_id, self.access_secret)
 
     def get_bucket(self, bucket_name: str) -> oss2.Bucket:
-        auth = self._get_auth()
-        return oss2.Bucket(auth, self.endpoint, bucket_name)
+        """
+        cached per bucket name, all sharing one pooled `oss2.Session`, i.e. connections reused across calls
+        """
+        bucket = self._buckets.get(bucket_name)
+        if bucket is not None:
+            return bucket
+        with self._lock:
+            if bucket_name not in self._buckets:
+                if self._session is None:
+                    self._session = oss2.Session(pool_size=self.pool_size)
+                self._buckets[bucket_name] = oss2.Bucket(
+                    self._get_auth(),
+                    self.endpoint,
+                    bucket_name,
+                    session=self._session,
+                )
+            return self._buckets[bucket_name]
 
     def create_bucket(self, bucket_name: str):
         try:
@@ -87,37 +121,23 @@ class OSS(object):
     def delete_bucket(self, bucket_name: str):
         bucket = self.get_bucket(bucket_name)
         bucket.delete_bucket()
-
-    def _update_progress_bar(self, file_name: str, total_bytes, consumed_bytes=0, mode='upload'):
-        progress_bar = self.progress_bars.get(file_name)
-        if progress_bar is None:
-            if mode == 'upload':
-                desc = f'{file_name} -> ({total_bytes / 1_000_000:.2f} m)'
-            else:
-                desc = f'({total_bytes / 1_000_000:.2f} m) -> {file_name}'
-
-            colors = ['white', 'cyan', 'blue', 'green', 'red', 'magenta', 'yellow']
-            bar = tqdm(total=total_bytes, unit=' bytes', desc=desc, ascii=' ━', colour=random.choice(colors))
-            progress_bar = ProgressBar(bar, 0)
-            self.progress_bars[file_name] = progress_bar
-        if consumed_bytes > 0:
-            delta = consumed_bytes - progress_bar.consumed
-            progress_bar.bar.update(delta)
-            progress_bar.consumed = consumed_bytes
-        if consumed_bytes == total_bytes:
-            progress_bar.bar.close()
-            del self.progress_bars[file_name]
-
-    def _finish_progress_bar(self, key: str):
-        if key not in self.progress_bars:
+        with self._lock:
+            self._buckets.pop(bucket_name, None)
+
+    def _transfer(self,
+                  tasks: list[tuple[str, str, int]],
+                  transfer: Callable[[str, str, int, int, TransferProgress], None],
+                  desc: str,
+                  progress_bar: bool):
+        """
+        :param tasks: list of (source, target, size)
+        :param transfer: transfer(source, target, size, part_threads, progress)
+        """
+        if len(tasks) == 0:
             return
-        try:
-            progress_bar, _ = self.progress_bars[key]
-            progress_bar.update(progress_bar.total - progress_bar.consumed)
-            progress_bar.close()
-            del self.progress_bars[key]
-        except Exception as e:
-            LOGGER.warning(e)
+        workers, part_threads = transfers.plan(tasks, self.part_size, self.part_threads, self.concurrency)
+        progress = transfers.run(tasks, transfer, workers, part_threads, self.part_size, desc, progress_bar)
+        LOGGER.info(f"[oss] {desc}: {progress.summary()}, {workers} workers x {part_threads} part threads")
 
     @staticmethod
     def _validate_oss_path(path):
@@ -129,11 +149,44 @@ class OSS(object):
         chunks = oss_path[6:].split('/')
         return chunks[0], '/'.join(chunks[1:])
 
-    def upload(self, path_local: str, path_oss: str, progress_bar: bool = True):
-        def show_progress(consumed_bytes, total_bytes):
-            if progress_bar:
-                self._update_progress_bar(file_name, total_bytes, consumed_bytes, mode='upload')
+    def _upload_file(self,
+                     bucket: oss2.Bucket,
+                     f_local: str,
+                     f_remote: str,
+                     size: int,
+                     part_threads: int,
+                     progress: TransferProgress):
+        oss2.resumable_upload(
+            bucket,
+            f_remote,
+            f_local,
+            multipart_threshold=self.part_size,
+            part_size=self.part_size,
+            num_threads=part_threads,
+            progress_callback=progress.callback(f_local),
+        )
+        progress.done(f_local, size)
+
+    def _download_file(self,
+                       bucket: oss2.Bucket,
+                       f_remote: str,
+                       f_local: str,
+                       size: int,
+                       part_threads: int,
+                       progress: TransferProgress):
+        paths.make_parent_dirs(f_local)
+        oss2.resumable_download(
+            bucket,
+            f_remote,
+            f_local,
+            multiget_threshold=self.part_size,
+            part_size=self.part_size,
+            num_threads=part_threads,
+            progress_callback=progress.callback(f_local),
+        )
+        progress.done(f_local, size)
 
+    def upload(self, path_local: str, path_oss: str, progress_bar: bool = True):
         path_local = paths.get_path(path_local)
         if not os.path.exists(path_local):
             raise ValueError(f"Local rile not found: {path_local}")
@@ -144,28 +197,24 @@ class OSS(object):
 
         LOGGER.info(f"[oss] {path_local} -> oss://{bucket_name}/{path_oss}")
         if os.path.isfile(path_local):
-            file_name = os.path.basename(path_local)
-            oss2.resumable_upload(bucket, path_oss, path_local, progress_callback=show_progress, num_threads=1)
-            if progress_bar:
-                self._finish_progress_bar(path_local)
+            tasks = [(path_local, path_oss, os.path.getsize(path_local))]
         else:
+            tasks = []
             for root, sub_dirs, files in os.walk(path_local):
                 for file in files:
                     if P_IGNORED.search(file) is not None:
                         continue
                     f_local = os.path.join(root, file)
                     f_remote = os.path.join(path_oss, self._remove_starting_slash(root.replace(path_local, '')), file)
-                    file_name = self._remove_starting_slash(os.path.join(root, file).replace(path_local, ''))
-                    oss2.resumable_upload(bucket, f_remote, f_local, progress_callback=show_progress, num_threads=1)
-                    if progress_bar:
-                        self._finish_progress_bar(f_local)
+                    tasks.append((f_local, f_remote, os.path.getsize(f_local)))
+        self._transfer(tasks, functools.partial(self._upload_file, bucket), 'upload', progress_bar)
 
     def delete(self, path_oss: str):
         bucket_name, path_oss = self._split_oss_path(path_oss)
         bucket = self.get_bucket(bucket_name)
         LOGGER.info(f"[oss] deleting: oss://{bucket_name}/{path_oss}")
         if path_oss.endswith('/'):
-            files = [obj.key for obj in oss2.ObjectIterator(bucket, prefix=path_oss)]
+            files = [obj.key for obj in oss2.ObjectIterator(bucket, prefix=path_oss, max_keys=MAX_KEYS)]
             if len(files) > 0:
                 bucket.batch_delete_objects(files)
         else:
@@ -176,16 +225,16 @@ class OSS(object):
         for path_oss in oss_paths:
             bucket_name, path_oss = self._split_oss_path(path_oss)
             batch[bucket_name].append(path_oss)
-        for bucket_name, files in batch.items():
+        for bucket_name, keys in batch.items():
             bucket = self.get_bucket(bucket_name)
-            bucket.batch_delete_objects(files)
+            bucket.batch_delete_objects(keys)
 
     def list_dir(self, path_oss: str):
         bucket_name, path_oss = self._split_oss_path(path_oss)
         bucket = self.get_bucket(bucket_name)
         if not path_oss.endswith('/'):
             path_oss += '/'
-        for obj in oss2.ObjectIterator(bucket, prefix=path_oss):
+        for obj in oss2.ObjectIterator(bucket, prefix=path_oss, max_keys=MAX_KEYS):
             yield obj.key
 
     def is_exist(self, path_oss: str):
@@ -196,21 +245,79 @@ class OSS(object):
         try:
             if not path_oss.endswith('/'):
                 path_oss += '/'
-            if next(oss2.ObjectIterator(bucket, prefix=path_oss)):
+            if next(oss2.ObjectIterator(bucket, prefix=path_oss, max_keys=1)):
                 return True
         except StopIteration:
             return False
         return False
 
+    def exists_many(self, oss_paths: list[str]) -> dict[str, bool]:
+        """
+        `is_exist` of many paths, by one listing per directory of 2+ paths instead of a request per path,
+        from the first path until past the last one and the objects under it;
+        `is_exist` per path for the others, and for what is not settled within a page per 2 paths
+        """
+        existed = {}
+        batch = defaultdict(list)
+        for path_oss in oss_paths:
+            bucket_name, key = self._split_oss_path(path_oss)
+            parent = key.rstrip('/').rpartition('/')[0]
+            batch[(bucket_name, parent)].append((path_oss, key))
+        for (bucket_name, parent), items in batch.items():
+            if parent == '' or len(items) == 1:
+                existed.update((path_oss, self.is_exist(path_oss)) for path_oss, _ in items)
+                continue
+            existed.update(self._exists_in(self.get_bucket(bucket_name), f"{parent}/", items))
+        return existed
+
+    def _exists_in(self, bucket: oss2.Bucket, prefix: str, items: list[tuple[str, str]]) -> dict[str, bool]:
+        # a path ending with `/` only exists as a directory, as in `is_exist`
+        pending_files = {key for _, key in items if not key.endswith('/')}
+        pending_dirs = {key.rstrip('/') for _, key in items if key.endswith('/')}
+        keys = pending_files | pending_dirs
+        first = min(keys)
+        # `x/a/c` sorts after `x/a-b`, the children of a path are not right after it
+        last = max(f"{key}/" for key in keys)
+        # the greatest key before `first`, the marker is exclusive
+        marker = f"{first[:-1]}{chr(ord(first[-1]) - 1)}{chr(sys.maxunicode)}"
+        max_objects = len(items) // 2 * MAX_KEYS
+        files, dirs = set(), set()
+        stopped_at = None
+        iterator = oss2.ObjectIterator(bucket, prefix=prefix, marker=marker, max_keys=MAX_KEYS)
+        for n_objects, obj in enumerate(iterator):
+            if len(pending_files) == 0 and len(pending_dirs) == 0:
+                break
+            if obj.key > last and not any(obj.key.startswith(key) for key in pending_files | pending_dirs):
+                break
+            if n_objects >= max_objects:
+                stopped_at = obj.key
+                break
+            parts = obj.key.rstrip('/').split('/')
+            parents = {'/'.join(parts[:i]) for i in range(1, len(parts))}
+            if obj.key.endswith('/'):
+                parents.add(obj.key.rstrip('/'))
+            else:
+                files.add(obj.key)
+                pending_files.discard(obj.key)
+            dirs |= parents
+            pending_files -= parents
+            pending_dirs -= parents
+        existed = {}
+        for path_oss, key in items:
+            is_dir, key_stripped = key.endswith('/'), key.rstrip('/')
+            # not listed up to the path and its children
+            unsettled = stopped_at is not None and (stopped_at < f"{key_stripped}/" or stopped_at.startswith(f"{key_stripped}/"))
+            if unsettled and key_stripped in (pending_dirs if is_dir else pending_files):
+                existed[path_oss] = self.is_exist(path_oss)
+            else:
+                existed[path_oss] = key.rstrip('/') in dirs if is_dir else key in files or key in dirs
+        return existed
+
     @staticmethod
     def _remove_starting_slash(file_remote: str):
         return file_remote[1:] if len(file_remote) > 0 and file_remote[0] == '/' else file_remote
 
     def download(self, path_oss: str, path_local: str, progress_bar: bool = True, overwrite: bool = False):
-        def show_progress(consumed_bytes, total_bytes):
-            if progress_bar:
-                self._update_progress_bar(file_name, total_bytes, consumed_bytes, mode='download')
-
         def should_skip_download(_file_remote, _file_local):
             if not os.path.exists(_file_local):
                 return False, None
@@ -218,11 +325,19 @@ class OSS(object):
                 return True, 'overwrite=False'
             try:
                 crc_remote = bucket.head_object(_file_remote).headers.get('x-oss-hash-crc64ecma')
-                crc_local = file_crc64(_file_local)
+                crc_local = file_crc64(_file_local, cache=True)
                 return crc_remote == crc_local, 'checksum same'
             except oss2.exceptions.NotFound:
                 return True, 'remote file missing'
 
+        def download_file(f_remote: str, f_local: str, size: int, part_threads: int, progress: TransferProgress):
+            should_skip, reason = should_skip_download(f_remote, f_local)
+            if should_skip:
+                LOGGER.debug(f"[oss] oss://{bucket_name}/{f_remote} -> {f_local}, skipped: {reason}")
+                progress.skip(f_local, size)
+                return
+            self._download_file(bucket, f_remote, f_local, size, part_threads, progress)
+
         bucket_name, path_oss = self._split_oss_path(path_oss)
         path_local = paths.get(path_local)
 
@@ -230,50 +345,146 @@ class OSS(object):
 
         LOGGER.info(f"[oss] oss://{bucket_name}/{path_oss} -> {path_local}, overwrite: {overwrite}")
         if not path_oss.endswith('/'):
-            if not bucket.object_exists(path_oss):
+            try:
+                size = bucket.head_object(path_oss).content_length
+            except oss2.exceptions.NotFound:
                 LOGGER.warning(f"[oss] remote file NOT exist: {path_oss}")
                 return
-            should_skip, reason = should_skip_download(path_oss, path_local)
-            if should_skip:
-                LOGGER.debug(f"[oss] oss://{bucket_name}/{path_oss} -> {path_local}, skipped: {reason}")
-                return
-            paths.make_parent_dirs(path_local)
             if os.path.isdir(path_local):
                 path_local = paths.get(path_local, os.path.basename(path_oss))
-            file_name = os.path.basename(path_local)
-            oss2.resumable_download(bucket, path_oss, path_local, progress_callback=show_progress, num_threads=1)
-            self._finish_progress_bar(path_local)
+            tasks = [(path_oss, path_local, size)]
         else:
-            n_downloaded = 0
-            for obj in oss2.ObjectIterator(bucket, prefix=path_oss):
+            tasks = []
+            for obj in oss2.ObjectIterator(bucket, prefix=path_oss, max_keys=MAX_KEYS):
                 f_remote = obj.key
                 if f_remote.endswith('/'):
                     continue
-
-                n_downloaded += 1
                 file_name = f_remote.replace(path_oss, '')
-                f_local = os.path.join(path_local, file_name)
-                should_skip, reason = should_skip_download(f_remote, f_local)
-                if should_skip:
-                    LOGGER.debug(f"[oss] oss://{bucket_name}/{f_remote} -> {f_local}, skipped: {reason}")
-                    continue
-                paths.make_parent_dirs(f_local)
-                oss2.resumable_download(bucket, f_remote, f_local, progress_callback=show_progress, num_threads=1)
-                self._finish_progress_bar(f_local)
-            if n_downloaded == 0:
+                tasks.append((f_remote, os.path.join(path_local, file_name), obj.size))
+            if len(tasks) == 0:
                 LOGGER.warning(f"[oss] remote file NOT exist: oss://{bucket_name}/{path_oss}")
+                return
+        self._transfer(tasks, download_file, 'download', progress_bar)
+
+    def prefetch(self, path_oss: str, path_local: str, link: str = 'hardlink', progress_bar: bool = True) -> str | None:
+        """
+        `download` through the local cache shared by the processes of the host, see `transfers.prefetch`,
+        addressed by the etag and size of the file, or of each file under the directory (path ending with `/`)
+        :return: the path in the cache, None if not found in oss
+        """
+        bucket_name, key = self._split_oss_path(path_oss)
+        bucket = self.get_bucket(bucket_name)
+        if key.endswith('/'):
+            objects = [(obj.key, obj.etag, obj.size) for obj in oss2.ObjectIterator(bucket, prefix=key, max_keys=MAX_KEYS) if not obj.key.endswith('/')]
+            if len(objects) == 0:
+                LOGGER.warning(f"[oss] remote file NOT exist: {path_oss}")
+                return None
+            identity = [path_oss, objects]
+        else:
+            try:
+                meta = bucket.head_object(key)
+            except oss2.exceptions.NotFound:
+                LOGGER.warning(f"[oss] remote file NOT exist: {path_oss}")
+                return None
+            identity = [path_oss, meta.etag, meta.content_length]
+        return transfers.prefetch(
+            identity,
+            lambda target: self.download(path_oss, target, progress_bar=progress_bar),
+            path_local,
+            name=os.path.basename(key.rstrip('/')),
+            link=link,
+        )
 
+    @staticmethod
+    def _is_same(bucket: oss2.Bucket, obj: oss2.models.SimplifiedObjectInfo, f_local: str) -> bool:
+        """
+        by the etag from the listing, the md5 of `Normal` objects, otherwise by crc64, with one `head_object`
+        """
+        if obj.type == 'Normal':
+            return obj.etag.lower() == files.md5(f_local, cache=True)
+        crc_remote = bucket.head_object(obj.key).headers.get('x-oss-hash-crc64ecma')
+        return crc_remote == file_crc64(f_local, cache=True)
+
+    def sync(self,
+             src: str,
+             dst: str,
+             delete: bool = False,
+             dry_run: bool = False,
+             progress_bar: bool = True) -> SyncResult:
+        """
+        Transfers only the new or changed files, between a local directory and an oss prefix, in either direction.
+        Listed once on each side; files of the same size compared by checksums, local ones from `files.ChecksumCache`.
+        :param delete: delete the files in `dst` not in `src`
+        :param dry_run: compare only, nothing transferred or deleted
+        """
+        upload = dst.startswith('oss://')
+        path_local, path_oss = (src, dst) if upload else (dst, src)
+        if path_local.startswith('oss://'):
+            raise ValueError(f"Expecting one local path and one oss path, got: {src}, {dst}")
+        bucket_name, prefix = self._split_oss_path(path_oss)
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+        path_local = paths.get(path_local)
+        if upload and not os.path.isdir(path_local):
+            raise ValueError(f"Local directory not found: {path_local}")
+
+        bucket = self.get_bucket(bucket_name)
+        local = transfers.list_local(path_local, lambda name: P_IGNORED.search(name) is not None)
+        remote = {
+            obj.key[len(prefix):]: obj
+            for obj in oss2.ObjectIterator(bucket, prefix=prefix, max_keys=MAX_KEYS)
+            if not obj.key.endswith('/')
+        }
+        sources, targets = (local, remote) if upload else (remote, local)
+
+        changed, same_sizes = [], []
+        for name in sources:
+            if name in local and name in remote and local[name] == remote[name].size:
+                same_sizes.append(name)
+            else:
+                changed.append(name)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            sames = executor.map(
+                lambda name: self._is_same(bucket, remote[name], os.path.join(path_local, name)),
+                same_sizes,
+            )
+            changed.extend(name for name, same in zip(same_sizes, sames) if not same)
+
+        result = SyncResult(
+            transferred=sorted(changed),
+            deleted=sorted(targets.keys() - sources.keys()) if delete else [],
+            n_unchanged=len(sources) - len(changed),
+        )
+        LOGGER.info(f"[oss] sync {src} -> {dst}: {result}{', dry run' if dry_run else ''}")
+        if dry_run:
+            return result
+
+        if upload:
+            tasks = [(os.path.join(path_local, name), f"{prefix}{name}", local[name]) for name in result.transferred]
+            self._transfer(tasks, functools.partial(self._upload_file, bucket), 'sync', progress_bar)
+            for i in range(0, len(result.deleted), 1000):
+                bucket.batch_delete_objects([f"{prefix}{name}" for name in result.deleted[i: i + 1000]])
+        else:
+            tasks = [(f"{prefix}{name}", os.path.join(path_local, name), remote[name].size) for name in result.transferred]
+            self._transfer(tasks, functools.partial(self._download_file, bucket), 'sync', progress_bar)
+            for name in result.deleted:
+                os.remove(os.path.join(path_local, name))
+        return result
 
-def file_crc64(file_name, block_size=64 * 1024, init_crc=0):
-    with open(file_name, 'rb') as f:
-        crc64 = oss2.utils.Crc64(init_crc)
-        while True:
-            data = f.read(block_size)
-            if not data:
-                break
-            crc64.update(data)
 
-    return str(crc64.crc)
+def file_crc64(file_name, block_size=64 * 1024, init_crc=0, cache: bool = False, workers: int = 1):
+    """
+    :param block_size: unused, the file is read through mmap, see `crc64.file_crc64`
+    :param cache: look up / save in the persistent `files.ChecksumCache`, only with `init_crc=0`
+    :param workers: number of processes computing file segments, combined after
+    """
+    if cache and init_crc == 0:
+        return files.checksum_cache().get_or_compute(
+            file_name,
+            ['crc64ecma'],
+            lambda _: {'crc64ecma': file_crc64(file_name, workers=workers)},
+        )['crc64ecma']
+    return str(crc64.file_crc64(file_name, init_crc, workers=workers))
 
 
 def download_cli():
@@ -296,12 +507,23 @@ def upload_cli():
     OSS.from_ossutilconfig().upload(path_local, path_oss)
 
 
+def sync(src: str, dst: str, delete: bool = False, dry_run: bool = False) -> SyncResult:
+    """
+    `OSS.sync` with credentials from `~/.ossutilconfig`, e.g. `sync('data/', 'oss://bucket/data/', delete=True)`
+    """
+    return OSS.from_ossutilconfig().sync(src, dst, delete=delete, dry_run=dry_run)
+
+
 def init(key='oss.init',
          overwrite: bool = False,
          oss_keys='oss.keys',
          default: list | dict = None,
          config: str | Config | None = None,
-         module: str | None = None):
+         module: str | None = None,
+         cache: bool = True,
+         link: str = 'hardlink',
+         workers: int = 4,
+         cache_max_age: float | None = transfers.PREFETCH_CACHE_MAX_AGE):
     """
     Download from oss to local according to `oss.init` in config yml, which should be
         - a dict
@@ -340,6 +562,10 @@ def init(key='oss.init',
         hao.oss.init('oss.init')         # download `model.general` and `model.product`
         hao.oss.init('model.general')    # download `model.general`
 
+    :param cache: fetched once per host into the shared cache and linked, see `OSS.prefetch`
+    :param link: `hardlink` or `symlink` from the cache
+    :param workers: entries downloaded concurrently
+    :param cache_max_age: seconds, the cache entries no longer linked and not used for as long are evicted
     """
     def _download(_item):
         if isinstance(_item, str):
@@ -355,7 +581,10 @@ def init(key='oss.init',
         if not overwrite and os.path.exists(path_local):
             return
         try:
-            oss.download(path_oss=path_oss, path_local=path_local, overwrite=overwrite)
+            if cache:
+                oss.prefetch(path_oss, path_local, link=link)
+            else:
+                oss.download(path_oss=path_oss, path_local=path_local, overwrite=overwrite)
         except requests.ConnectionError as e:
             if not os.path.exists(path_local):
                 raise e
@@ -380,11 +609,15 @@ def init(key='oss.init',
         items = cfg.get(items)
 
     if isinstance(items, list):
-        for item in items:
-            _download(item)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as executor:
+            list(executor.map(_download, items))
     elif isinstance(items, dict):
         _download(items)
     else:
         LOGGER.info(f"[oss] '{key}' not supported type")
+    if cache:
+        evicted = transfers.evict_prefetch_cache(max_age=cache_max_age)
+        if len(evicted) > 0:
+            LOGGER.info(f"[oss] evicted from the prefetch cache: {len(evicted)} entries no longer linked")
 
     LOGGER.info(f'[oss] init key: {key} finished, took: {sw.took()}')
@@ -1,25 +1,84 @@
 # -*- coding: utf-8 -*-
-from collections.abc import Generator
+import codecs
+import functools
+import pickle
+from collections.abc import Callable, Generator, Iterable, Iterator
 from re import Pattern
+from typing import IO
 
 import regex
 
+from . import paths
+
 P_CHINESE = regex.compile(u'[\u4e00-\u9fa5]+')
 P_HTML_TAGS = regex.compile('<[^>]*>')
 P_NON_CHAR = regex.compile('[^a-zA-Z0-9]')
 
 
-def re_compile(items, prefix='', suffix='', flags=regex.I):
+def re_compile(items, prefix='', suffix='', flags=regex.I, literal: bool = False, optimize: bool = False):
+    """
+    :param literal: items are plain keywords instead of patterns, matched by an `AhoCorasick` automaton,
+        linear in text length regardless of the number of items; `prefix` and `suffix` not supported
+    :param optimize: items are plain keywords, factored by common prefixes into one pattern, see `join_items`
+    """
     if items is None or len(items) == 0:
         return None
-    pattern = join_items(items, prefix, suffix)
+    if literal:
+        if prefix or suffix:
+            raise ValueError('prefix / suffix not supported with literal=True')
+        return AhoCorasick(items, ignore_case=bool(flags & regex.I))
+    pattern = join_items(items, prefix, suffix, optimize)
     return regex.compile(pattern, flags)
 
 
-def join_items(items, prefix='', suffix=''):
+def join_items(items, prefix='', suffix='', optimize: bool = False):
+    """
+    :param optimize: treat items as plain keywords (escaped), and build a prefix trie of them
+        to emit a factored pattern, e.g. `foo(?:ba[rz]|d)`, prefers the longest keyword at the same position
+    """
+    if optimize:
+        trie = _build_trie([_item.strip() for _item in items if len(_item.strip()) > 0])
+        if len(trie) == 0:
+            return ''
+        return f'{prefix}{_trie_to_pattern(trie)}{suffix}'
     return r'|'.join([f'(?:{prefix}{_item.strip()}{suffix})' for _item in items if len(_item) > 0])
 
 
+def _build_trie(items: list[str]) -> dict:
+    trie = {}
+    for item in items:
+        node = trie
+        for c in item:
+            node = node.setdefault(c, {})
+        node[''] = None
+    return trie
+
+
+def _trie_to_pattern(node: dict) -> str:
+    optional = '' in node
+    chars, alternatives = [], []
+    for c in sorted(k for k in node if k):
+        child = node[c]
+        if len(child) == 1 and '' in child:
+            chars.append(regex.escape(c))
+        else:
+            alternatives.append(f'{regex.escape(c)}{_trie_to_pattern(child)}')
+    if len(chars) == 1:
+        alternatives.append(chars[0])
+    elif len(chars) > 1:
+        alternatives.append(f"[{''.join(chars)}]")
+
+    if len(alternatives) == 0:
+        return ''
+    if len(alternatives) == 1:
+        pattern = alternatives[0]
+        if not optional:
+            return pattern
+        return f'{pattern}?' if len(chars) > 0 or len(pattern) == 1 else f'(?:{pattern})?'
+    pattern = f"(?:{'|'.join(alternatives)})"
+    return f'{pattern}?' if optional else pattern
+
+
 def split_with_sep(text: str, p: Pattern, sep_as_ending: bool = True) -> Generator[str, None, None]:
     if text is None or p is None:
         return None
@@ -45,9 +104,237 @@ def split_with_sep(text: str, p: Pattern, sep_as_ending: bool = True) -> Generat
         yield item
 
 
+def split_with_sep_stream(chunks: Iterable[str | bytes] | IO,
+                          p: Pattern | str,
+                          sep_as_ending: bool = True,
+                          chunk_size: int = 1024 * 1024,
+                          encoding: str = 'utf-8') -> Generator[str, None, None]:
+    """
+    Same as `split_with_sep`, but consumes an iterator of text chunks or a file object, and yields segments incrementally.
+    Separators spanning chunk boundaries are handled; memory is bounded by the chunk size plus the longest segment.
+    :param chunks: iterable of str / bytes, or a file object opened in text or binary mode
+    :param chunk_size: read size when `chunks` is a file object
+    :param encoding: used to decode bytes chunks
+    """
+    if chunks is None or p is None:
+        return None
+    if isinstance(p, str):
+        p = regex.compile(p)
+    if hasattr(chunks, 'read'):
+        chunks = iter(functools.partial(chunks.read, chunk_size), chunks.read(0))
+    partial = {'partial': True} if isinstance(p, regex.Pattern) else {}
+    decoder = None
+
+    buffer, cache, i, pos = '', '', 0, 0
+
+    def consume(final: bool):
+        nonlocal cache, i, pos
+        for m in p.finditer(buffer, pos, **({} if final else partial)):
+            start, end = m.span()
+            if not final and (end == len(buffer) or getattr(m, 'partial', False)):
+                break
+            pos = end
+            if sep_as_ending:
+                item = (buffer[i:start] + m.group()).strip()
+            else:
+                item = (cache + buffer[i:start]).strip()
+                cache = m.group()
+
+            if len(item) == 0:
+                continue
+            yield item
+            i = end
+
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+        if not chunk:
+            continue
+        buffer = buffer[i:] + chunk
+        pos -= i
+        i = 0
+        yield from consume(final=False)
+    if decoder is not None:
+        buffer += decoder.decode(b'', final=True)
+
+    yield from consume(final=True)
+    if sep_as_ending:
+        item = buffer[i:].strip()
+    else:
+        item = (cache + buffer[i:]).strip()
+    if len(item) > 0:
+        yield item
+
+
 def remove_html_tags(text: str):
     return P_HTML_TAGS.sub('', text) if text else None
 
 
 def remove_non_char(text: str):
     return P_NON_CHAR.sub('', text) if text else None
+
+
+class Match:
+    __slots__ = ['string', 'keyword', '_start', '_end']
+
+    def __init__(self, string: str, start: int, end: int, keyword: str) -> None:
+        self.string = string
+        self.keyword = keyword
+        self._start = start
+        self._end = end
+
+    def group(self, index: int = 0):
+        if index != 0:
+            raise IndexError('no such group')
+        return self.string[self._start:self._end]
+
+    def __getitem__(self, index: int):
+        return self.group(index)
+
+    def start(self, index: int = 0):
+        return self._start
+
+    def end(self, index: int = 0):
+        return self._end
+
+    def span(self, index: int = 0):
+        return self._start, self._end
+
+    def __repr__(self):
+        return f"<hao.regexes.Match object; span={self.span()}, match={self.group()!r}>"
+
+
+class AhoCorasick:
+    """
+    Multi-keyword matcher with the `search` / `finditer` / `findall` / `sub` interface of a compiled pattern.
+    Matches are leftmost-longest and non-overlapping.
+    """
+
+    def __init__(self, items: list[str], ignore_case: bool = True) -> None:
+        super().__init__()
+        self.ignore_case = ignore_case
+        self.flags = regex.I if ignore_case else 0
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._depth: list[int] = [0]
+        self._keyword: list[str | None] = [None]
+        self._longest: list[int] = [0]
+        for item in items:
+            self._add(item)
+        self._build()
+
+    def _add(self, item: str):
+        item = item.strip() if item else None
+        if not item:
+            return
+        state = 0
+        for c in self._fold(item):
+            nxt = self._goto[state].get(c)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._depth.append(self._depth[state] + 1)
+                self._keyword.append(None)
+                self._longest.append(0)
+                self._goto[state][c] = nxt
+            state = nxt
+        self._keyword[state] = item
+
+    def _build(self):
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._longest[state] = self._depth[state] if self._keyword[state] is not None else 0
+        i = 0
+        while i < len(queue):
+            state = queue[i]
+            i += 1
+            for c, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(c, 0)
+                self._fail[nxt] = fail if fail != nxt else 0
+                own = self._depth[nxt] if self._keyword[nxt] is not None else 0
+                self._longest[nxt] = max(own, self._longest[self._fail[nxt]])
+
+    def __len__(self):
+        return sum(1 for keyword in self._keyword if keyword is not None)
+
+    def _fold(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        folded = text.lower()
+        if len(folded) == len(text):
+            return folded
+        return ''.join([c if len(c.lower()) != 1 else c.lower() for c in text])
+
+    def _keyword_of(self, state: int, length: int) -> str | None:
+        while state and self._depth[state] >= length:
+            if self._depth[state] == length and self._keyword[state] is not None:
+                return self._keyword[state]
+            state = self._fail[state]
+        return None
+
+    def finditer(self, text: str, pos: int = 0, endpos: int | None = None) -> Iterator[Match]:
+        if text is None:
+            return
+        folded = self._fold(text)
+        goto, fail, depth, longest = self._goto, self._fail, self._depth, self._longest
+        end = len(text) if endpos is None else min(endpos, len(text))
+        state, i = 0, pos
+        best_start, best_end, best_state = -1, -1, 0
+        while i < end or best_start >= 0:
+            if i < end:
+                c = folded[i]
+                while state and c not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(c, 0)
+                i += 1
+                length = longest[state]
+                if length and (best_start < 0 or i - length <= best_start):
+                    best_start, best_end, best_state = i - length, i, state
+            if best_start >= 0 and (i >= end or i - depth[state] > best_start):
+                yield Match(text, best_start, best_end, self._keyword_of(best_state, best_end - best_start))
+                state, i = 0, best_end
+                best_start = -1
+
+    def search(self, text: str, pos: int = 0, endpos: int | None = None) -> Match | None:
+        return next(self.finditer(text, pos, endpos), None)
+
+    def findall(self, text: str, pos: int = 0, endpos: int | None = None) -> list[str]:
+        return [m.group() for m in self.finditer(text, pos, endpos)]
+
+    def sub(self, repl: str | Callable[[Match], str], text: str, count: int = 0) -> str:
+        """
+        :param repl: replacement string (taken literally, no backreferences), or a function taking the `Match`
+        """
+        if text is None:
+            return None
+        chunks, i = [], 0
+        for n, m in enumerate(self.finditer(text), start=1):
+            start, end = m.span()
+            chunks.append(text[i:start])
+            chunks.append(repl(m) if callable(repl) else repl)
+            i = end
+            if count and n >= count:
+                break
+        chunks.append(text[i:])
+        return ''.join(chunks)
+
+    def save(self, path: str):
+        path = paths.get(path)
+        paths.make_parent_dirs(path)
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> 'AhoCorasick':
+        with open(paths.get(path), 'rb') as f:
+            automaton = pickle.load(f)
+        if not isinstance(automaton, cls):
+            raise ValueError(f"expecting {cls.__name__} in {path}, actual: {type(automaton).__name__}")
+        return automaton
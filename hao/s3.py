@@ -13,23 +13,54 @@ s3.{profile}
   secret_key: IBvOcYjjPYB3PqGBpbryfqvxy4NWvX8oqSncYlwY
 """
 import configparser
+import functools
+import hashlib
+import json
 import logging
 import math
 import os
-import random
 import signal
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 
+import certifi
+import urllib3
 from minio import Minio
-from minio.error import MinioException
-from tqdm import tqdm
+from minio.datatypes import Object
+from minio.deleteobjects import DeleteObject
+from minio.error import MinioException, S3Error
+from minio.helpers import MIN_PART_SIZE, get_part_info
 
-from . import config, paths, strings
+from . import config, files, paths, strings, transfers
 from .stopwatch import Stopwatch
+from .transfers import SyncResult, TransferProgress
 
 LOGGER = logging.getLogger(__name__)
 
 IGNORED = ('.DS_Store', 'Thumbs.db', 'Thumbs.db:encryptable', 'ehthumbs.db', 'ehthumbs_vista.db')
 
+MB = 1024 * 1024
+PART_SIZE = 8 * MB
+
+
+class _Progress:
+    """
+    minio's progress interface, reporting the bytes of each `update` to a `TransferProgress`
+    """
+
+    def __init__(self, progress: TransferProgress, key: str) -> None:
+        super().__init__()
+        self.progress = progress
+        self.key = key
+
+    def set_meta(self, object_name: str, total_length: int):
+        pass
+
+    def update(self, length: int):
+        self.progress.advance(self.key, length)
+
 
 class S3:
     def __init__(self,
@@ -38,21 +69,39 @@ class S3:
                  endpoint: str | None = None,
                  access_key: str | None = None,
                  secret_key: str | None = None,
-                 secure: bool = False) -> None:
-        if endpoint is None or access_key is None or secret_key is None:
-            conf = config.get(f"s3.{profile}")
-            if conf is None or len(conf) == 0:
-                raise ValueError('Empty config')
-            endpoint = conf.get('endpoint')
-            access_key = conf.get('access_key')
-            secret_key = conf.get('secret_key')
-            secure = conf.get('secure', secure)
+                 secure: bool = False,
+                 part_size: int = PART_SIZE,
+                 part_threads: int = 4,
+                 concurrency: int = 16,
+                 client: Minio | None = None) -> None:
+        """
+        :param part_size: files larger than it are transferred in parts of it, at least 5 MB for uploads
+        :param part_threads: threads per file transferring parts, in directory transfers
+        :param concurrency: budget of concurrent requests, shared by file workers x part threads, also the connection pool size
+        :param client: e.g. to a local minio or an in-process stand-in, then no endpoint / keys needed
+        """
+        if client is None:
             if endpoint is None or access_key is None or secret_key is None:
-                raise ValueError(f"`endpoint`, `access_key` and `secret_key` are required, but not satisfied (s3.{profile})")
-        self.client = Minio(endpoint, access_key, secret_key, secure=secure)
+                conf = config.get(f"s3.{profile}")
+                if conf is None or len(conf) == 0:
+                    raise ValueError('Empty config')
+                endpoint = conf.get('endpoint')
+                access_key = conf.get('access_key')
+                secret_key = conf.get('secret_key')
+                secure = conf.get('secure', secure)
+                if endpoint is None or access_key is None or secret_key is None:
+                    raise ValueError(f"`endpoint`, `access_key` and `secret_key` are required, but not satisfied (s3.{profile})")
+            client = Minio(endpoint, access_key, secret_key, secure=secure, http_client=_http_client(concurrency))
+        self.client = client
+        self.part_size = part_size
+        self.part_threads = part_threads
+        self.concurrency = concurrency
 
     @classmethod
-    def from_s3config(cls):
+    def from_s3config(cls, **kwargs):
+        """
+        :param kwargs: see `S3.__init__`, e.g. `concurrency`
+        """
         config_file = '~/.s3config'
         config_path = paths.get(config_file)
         if not os.path.exists(config_path):
@@ -67,55 +116,454 @@ class S3:
         secure = strings.boolean(cfg.get('secure'), False)
         if endpoint is None or access_key is None or secret_key is None:
             raise ValueError(f"`endpoint`, `access_key` and `secret_key` are required, but not satisfied ({config_file})")
-        return S3(endpoint=endpoint, access_key=access_key, secret_key=secret_key, secure=secure)
+        return S3(endpoint=endpoint, access_key=access_key, secret_key=secret_key, secure=secure, **kwargs)
+
+    @staticmethod
+    def _split_s3_path(path_s3: str) -> tuple[str, str]:
+        if path_s3 is None or not path_s3.startswith('s3://'):
+            raise ValueError(f"Invalid s3 path: {path_s3}")
+        bucket_name, _, object_name = path_s3[5:].partition('/')
+        return bucket_name, object_name
+
+    def _transfer(self,
+                  tasks: list[tuple[str, str, int]],
+                  transfer: Callable[[str, str, int, int, TransferProgress], None],
+                  desc: str,
+                  progress_bar: bool):
+        """
+        :param tasks: list of (source, target, size)
+        :param transfer: transfer(source, target, size, part_threads, progress)
+        """
+        if len(tasks) == 0:
+            return
+        workers, part_threads = transfers.plan(tasks, self.part_size, self.part_threads, self.concurrency)
+        progress = transfers.run(tasks, transfer, workers, part_threads, self.part_size, desc, progress_bar)
+        LOGGER.info(f"[s3] {desc}: {progress.summary()}, {workers} workers x {part_threads} part threads")
+
+    def _upload_file(self,
+                     bucket_name: str,
+                     f_local: str,
+                     object_name: str,
+                     size: int,
+                     part_threads: int,
+                     progress: TransferProgress):
+        self.client.fput_object(
+            bucket_name,
+            object_name,
+            f_local,
+            part_size=self.part_size,
+            num_parallel_uploads=part_threads,
+            progress=_Progress(progress, f_local),
+        )
+        progress.done(f_local, size)
+
+    def upload(self, path_local: str, path_s3: str, progress_bar: bool = True):
+        """
+        a file, or a directory to `s3://{bucket}/{prefix}/`, in multipart uploads with concurrent parts
+        """
+        path_local = paths.get(path_local)
+        if not os.path.exists(path_local):
+            raise ValueError(f"Local file not found: {path_local}")
+        bucket_name, object_name = self._split_s3_path(path_s3)
+        LOGGER.info(f"[s3] {path_local} -> s3://{bucket_name}/{object_name}")
+        if os.path.isfile(path_local):
+            tasks = [(path_local, object_name, os.path.getsize(path_local))]
+        else:
+            prefix = f"{object_name.rstrip('/')}/" if object_name else ''
+            tasks = [
+                (os.path.join(path_local, name), f"{prefix}{name}", size)
+                for name, size in transfers.list_local(path_local, lambda name: name in IGNORED).items()
+            ]
+        self._transfer(tasks, functools.partial(self._upload_file, bucket_name), 'upload', progress_bar)
+
+    def list_dir(self, path_s3: str, recursive: bool = True) -> Iterator[Object]:
+        """
+        objects under `s3://{bucket}/{prefix}/`, fetched page by page as iterated
+        :param recursive: otherwise only the direct children, sub directories as objects with `is_dir`
+        """
+        bucket_name, prefix = self._split_s3_path(path_s3)
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+        yield from self.client.list_objects(bucket_name, prefix=prefix, recursive=recursive)
+
+    def delete_prefix(self, path_s3: str) -> int:
+        """
+        all objects under `s3://{bucket}/{prefix}/`, listed and deleted in batches of up to 1000 by `remove_objects`;
+        `prefix` is a directory, i.e. `data/run1` doesn't cover `data/run10/`, and not empty, never the whole bucket
+        :return: number of objects deleted
+        """
+        bucket_name, prefix = self._split_s3_path(path_s3)
+        if not prefix.strip('/'):
+            raise ValueError(f"Refused to delete the whole bucket, prefix required: {path_s3}")
+        if not prefix.endswith('/'):
+            prefix += '/'
+        LOGGER.info(f"[s3] deleting: s3://{bucket_name}/{prefix}")
+        keys = [obj.object_name for obj in self.client.list_objects(bucket_name, prefix=prefix, recursive=True)]
+        self._delete_objects(bucket_name, keys)
+        return len(keys)
 
-    def download(self, path_s3: str, path_local: str, overwrite: bool = False):
+    def _delete_objects(self, bucket_name: str, keys: list[str]):
+        errors = [
+            f"{error.name}: {error.message}"
+            for error in self.client.remove_objects(bucket_name, (DeleteObject(key) for key in keys))
+        ]
+        if len(errors) > 0:
+            raise MinioException(f"Failed to delete {len(errors)} objects, e.g. {errors[:3]}")
+
+    def download(self,
+                 path_s3: str,
+                 path_local: str,
+                 overwrite: bool = False,
+                 part_size: int | None = None,
+                 workers: int | None = None,
+                 verify: bool = True,
+                 progress_bar: bool = True):
+        """
+        Parts of `part_size` fetched by range requests over `workers` connections, written in place with `pwrite`
+        into the preallocated `{path_local}.download`, renamed to `path_local` when complete.
+        Finished parts are recorded in `{path_local}.download.json`, an interrupted download resumes from them
+        as long as the object is unchanged.
+        :param path_s3: `s3://{bucket}/{object}` or `{bucket}/{object}`
+        :param part_size: default to `part_size` of the instance
+        :param workers: concurrent range requests, default to `concurrency`
+        :param verify: check the size, and the etag (md5, or multipart etag if the part size can be inferred)
+        """
         assert path_s3 is not None
         assert path_local is not None
         path_local = paths.get(path_local)
         if not overwrite and os.path.exists(path_local):
             return
 
-        response = None
-        stop = False
+        if path_s3.startswith('s3://'):
+            bucket_name, object_name = self._split_s3_path(path_s3)
+        else:
+            bucket_name, _, object_name = path_s3.partition(os.path.sep)
+        obj = self.client.stat_object(bucket_name, object_name)
+        n_parts = math.ceil(obj.size / (part_size or self.part_size))
+        with TransferProgress(obj.size, 1, os.path.basename(object_name), enabled=progress_bar) as progress:
+            self._download(obj, path_local, part_size, workers or self.concurrency, verify, progress)
+        LOGGER.debug(f"[s3] {path_s3} -> {path_local}: {progress.summary()}, {n_parts} parts")
+
+    def _download(self,
+                  obj: Object,
+                  path_local: str,
+                  part_size: int | None,
+                  workers: int,
+                  verify: bool,
+                  progress: TransferProgress):
+        bucket_name, object_name, size, etag = obj.bucket_name, obj.object_name, obj.size, obj.etag
+        part_size = part_size or self.part_size
+        f_part, f_state = f"{path_local}.download", f"{path_local}.download.json"
+        state = _load_state(f_state)
+        if not os.path.exists(f_part) or state.get('etag') != etag or state.get('size') != size or state.get('part_size') != part_size:
+            state = {'etag': etag, 'size': size, 'part_size': part_size, 'done': []}
+        done = set(state['done'])
+        ranges = []
+        for i, start in enumerate(range(0, size, part_size)):
+            end = min(start + part_size, size)
+            if i in done:
+                progress.resume(path_local, end - start)
+            else:
+                ranges.append((i, start, end))
+        lock, stop = threading.Lock(), threading.Event()
+
+        def fetch(index: int, start: int, end: int):
+            if stop.is_set():
+                return
+            response = self.client.get_object(
+                bucket_name,
+                object_name,
+                offset=start,
+                length=end - start,
+                request_headers={'If-Match': etag},
+            )
+            try:
+                offset = start
+                for chunk in response.stream(MB):
+                    if stop.is_set():
+                        return
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    progress.advance(path_local, len(chunk))
+            finally:
+                response.close()
+                response.release_conn()
+            if offset != end:
+                raise MinioException(f"Incomplete range [{start}, {end}) of {object_name}: {offset - start} bytes")
+            with lock:
+                state['done'].append(index)
+                _save_state(f_state, state)
+
         def handle_stop(signum, frame):
-            nonlocal stop
-            stop = True
+            stop.set()
 
+        handlers = None
+        if threading.current_thread() is threading.main_thread():
+            handlers = signal.signal(signal.SIGINT, handle_stop), signal.signal(signal.SIGTERM, handle_stop)
+        paths.make_parent_dirs(path_local)
+        fd = os.open(f_part, os.O_RDWR | os.O_CREAT, 0o644)
         try:
-            signal.signal(signal.SIGINT, handle_stop)
-            signal.signal(signal.SIGTERM, handle_stop)
-            splits = path_s3.split(os.path.sep)
-            bucket_name = splits[0]
-            object_name = os.path.sep.join(splits[1:])
-            response = self.client.get_object(bucket_name, object_name)
-            total_length = int(response.headers.get('content-length'))
-            filename = os.path.basename(object_name)
-            filesize_kb = total_length / 1024
-            desc = f'{filename} -> ({filesize_kb / 1024:.2f} m)'
-            color = random.choice(['cyan', 'blue', 'green', 'red', 'magenta', 'yellow'])
-            bar = tqdm(total=math.ceil(filesize_kb), unit='k', ascii=' ―', colour=color, desc=desc)
-            paths.make_parent_dirs(path_local)
-            with open(path_local, 'wb') as f:
-                for d in response.stream(1024 * 1024):
-                    if stop:
-                        raise KeyboardInterrupt()
-                    size = f.write(d)
-                    bar.update(size // 1024)
-            bar.close()
-        except KeyboardInterrupt:
-            paths.delete(path_local)
-            return
-        except MinioException as e:
-            paths.delete(path_local)
-            raise e
+            if os.fstat(fd).st_size != size:
+                os.ftruncate(fd, size)
+            if workers <= 1 or len(ranges) <= 1:
+                for r in ranges:
+                    fetch(*r)
+            else:
+                with ThreadPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+                    for future in as_completed([executor.submit(fetch, *r) for r in ranges]):
+                        future.result()
         finally:
-            if response:
-                response.close()
-                response.release_conn()
+            os.close(fd)
+            if handlers is not None:
+                signal.signal(signal.SIGINT, handlers[0])
+                signal.signal(signal.SIGTERM, handlers[1])
+        if stop.is_set():
+            LOGGER.info(f"[s3] {object_name} -> {path_local}, interrupted, {len(state['done'])} parts kept to resume")
+            return
+
+        if verify and not _verify(f_part, size, etag):
+            paths.delete(f_part)
+            paths.delete(f_state)
+            raise MinioException(f"Downloaded file not matching size / etag of {object_name}: {size}, {etag}")
+        os.replace(f_part, path_local)
+        paths.delete(f_state)
+        progress.done(path_local)
+
+    def _download_file(self,
+                       obj: Object,
+                       f_local: str,
+                       size: int,
+                       part_threads: int,
+                       progress: TransferProgress,
+                       overwrite: bool = True):
+        if not overwrite and os.path.exists(f_local):
+            progress.skip(f_local, size)
+            return
+        self._download(obj, f_local, None, part_threads, True, progress)
+
+    def download_dir(self, path_s3: str, path_local: str, overwrite: bool = False, progress_bar: bool = True):
+        """
+        all objects under `s3://{bucket}/{prefix}/`, each by ranged parallel download as in `download`
+        """
+        bucket_name, prefix = self._split_s3_path(path_s3)
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+        path_local = paths.get(path_local)
+        LOGGER.info(f"[s3] s3://{bucket_name}/{prefix} -> {path_local}, overwrite: {overwrite}")
+        tasks = [
+            (obj, os.path.join(path_local, obj.object_name[len(prefix):]), obj.size)
+            for obj in self.client.list_objects(bucket_name, prefix=prefix, recursive=True)
+            if not obj.is_dir
+        ]
+        if len(tasks) == 0:
+            LOGGER.warning(f"[s3] remote file NOT exist: s3://{bucket_name}/{prefix}")
+            return
+        self._transfer(tasks, functools.partial(self._download_file, overwrite=overwrite), 'download', progress_bar)
+
+    def prefetch(self, path_s3: str, path_local: str, link: str = 'hardlink', progress_bar: bool = True) -> str | None:
+        """
+        `download` / `download_dir` through the local cache shared by the processes of the host, see `transfers.prefetch`,
+        addressed by the etag and size of the object, or of each object under the prefix (path ending with `/`)
+        :param path_s3: `s3://{bucket}/{object}` or `{bucket}/{object}`
+        :return: the path in the cache, None if not found in s3
+        """
+        if not path_s3.startswith('s3://'):
+            path_s3 = f"s3://{path_s3}"
+        bucket_name, object_name = self._split_s3_path(path_s3)
+        if object_name.endswith('/'):
+            objects = [(obj.object_name, obj.etag, obj.size) for obj in self.list_dir(path_s3) if not obj.is_dir]
+            if len(objects) == 0:
+                LOGGER.warning(f"[s3] remote file NOT exist: {path_s3}")
+                return None
+            identity = [path_s3, objects]
+            fetch = functools.partial(self.download_dir, path_s3, progress_bar=progress_bar)
+        else:
+            try:
+                obj = self.client.stat_object(bucket_name, object_name)
+            except S3Error as e:
+                if e.code not in ('NoSuchKey', 'NoSuchBucket'):
+                    raise e
+                LOGGER.warning(f"[s3] remote file NOT exist: {path_s3}")
+                return None
+            identity = [path_s3, obj.etag, obj.size]
+            fetch = functools.partial(self.download, path_s3, progress_bar=progress_bar)
+        return transfers.prefetch(identity, fetch, path_local, name=os.path.basename(object_name.rstrip('/')), link=link)
 
+    @staticmethod
+    def _is_same(obj: Object, f_local: str) -> bool:
+        """
+        by the etag from the listing, the md5 of objects uploaded in one piece, otherwise the multipart etag
+        """
+        if '-' not in obj.etag:
+            return obj.etag == files.md5(f_local, cache=True)
+        n_parts = int(obj.etag.rsplit('-', 1)[1])
+        return any(obj.etag == file_etag(f_local, part_size, cache=True) for part_size in _part_sizes(obj.size, n_parts))
 
-def init(key='s3.init', overwrite: bool = False):
+    def sync(self,
+             src: str,
+             dst: str,
+             delete: bool = False,
+             dry_run: bool = False,
+             progress_bar: bool = True) -> SyncResult:
+        """
+        Transfers only the new or changed files, between a local directory and `s3://{bucket}/{prefix}`, in either direction.
+        Listed once on each side; files of the same size compared by etags, local checksums from `files.ChecksumCache`.
+        :param delete: delete the files in `dst` not in `src`
+        :param dry_run: compare only, nothing transferred or deleted
+        """
+        upload = dst.startswith('s3://')
+        path_local, path_s3 = (src, dst) if upload else (dst, src)
+        if path_local.startswith('s3://'):
+            raise ValueError(f"Expecting one local path and one s3 path, got: {src}, {dst}")
+        bucket_name, prefix = self._split_s3_path(path_s3)
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+        path_local = paths.get(path_local)
+        if upload and not os.path.isdir(path_local):
+            raise ValueError(f"Local directory not found: {path_local}")
+
+        local = transfers.list_local(path_local, lambda name: name in IGNORED)
+        remote = {
+            obj.object_name[len(prefix):]: obj
+            for obj in self.client.list_objects(bucket_name, prefix=prefix, recursive=True)
+            if not obj.is_dir
+        }
+        sources, targets = (local, remote) if upload else (remote, local)
+
+        changed, same_sizes = [], []
+        for name in sources:
+            if name in local and name in remote and local[name] == remote[name].size:
+                same_sizes.append(name)
+            else:
+                changed.append(name)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            sames = executor.map(lambda name: self._is_same(remote[name], os.path.join(path_local, name)), same_sizes)
+            changed.extend(name for name, same in zip(same_sizes, sames) if not same)
+
+        result = SyncResult(
+            transferred=sorted(changed),
+            deleted=sorted(targets.keys() - sources.keys()) if delete else [],
+            n_unchanged=len(sources) - len(changed),
+        )
+        LOGGER.info(f"[s3] sync {src} -> {dst}: {result}{', dry run' if dry_run else ''}")
+        if dry_run:
+            return result
+
+        if upload:
+            tasks = [(os.path.join(path_local, name), f"{prefix}{name}", local[name]) for name in result.transferred]
+            self._transfer(tasks, functools.partial(self._upload_file, bucket_name), 'sync', progress_bar)
+            self._delete_objects(bucket_name, [f"{prefix}{name}" for name in result.deleted])
+        else:
+            tasks = [(remote[name], os.path.join(path_local, name), remote[name].size) for name in result.transferred]
+            self._transfer(tasks, self._download_file, 'sync', progress_bar)
+            for name in result.deleted:
+                os.remove(os.path.join(path_local, name))
+        return result
+
+
+def _http_client(maxsize: int) -> urllib3.PoolManager:
+    """
+    as minio's default, but a connection pool of `maxsize` instead of 10, one connection per concurrent request
+    """
+    timeout = timedelta(minutes=5).seconds
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        maxsize=maxsize,
+        cert_reqs='CERT_REQUIRED',
+        ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+
+
+def _load_state(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(path: str, state: dict):
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(state, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def _verify(filename: str, size: int, etag: str) -> bool:
+    """
+    size and etag, multipart etags checked with the inferred part sizes, accepted with a warning if none fits
+    """
+    if os.path.getsize(filename) != size:
+        return False
+    if '-' not in etag:
+        return files.md5(filename) == etag
+    n_parts = int(etag.rsplit('-', 1)[1])
+    if any(etag == file_etag(filename, part_size) for part_size in _part_sizes(size, n_parts)):
+        return True
+    LOGGER.warning(f"[s3] etag not verified, unknown part size of {n_parts} parts: {filename}")
+    return True
+
+
+def _part_sizes(size: int, n_parts: int) -> list[int]:
+    """
+    candidate part sizes of an object uploaded in `n_parts`: minio's default, common defaults,
+    and the smallest whole MB satisfying `(n_parts - 1) * part_size < size <= n_parts * part_size`
+    """
+    if n_parts <= 1:
+        return [max(size, 1)]
+    candidates = [get_part_info(size, 0)[0], MIN_PART_SIZE, 8 * MB, 16 * MB, 64 * MB, math.ceil(size / n_parts / MB) * MB]
+    part_sizes = []
+    for part_size in candidates:
+        if (n_parts - 1) * part_size < size <= n_parts * part_size and part_size not in part_sizes:
+            part_sizes.append(part_size)
+    return part_sizes
+
+
+def file_etag(filename: str, part_size: int, cache: bool = False) -> str:
+    """
+    the etag of the file uploaded in parts of `part_size`, md5 of the concatenated part md5s, suffixed by `-{n_parts}`
+    :param cache: look up / save in the persistent `files.ChecksumCache`
+    """
+    if cache:
+        algorithm = f"etag-{part_size}"
+        return files.checksum_cache().get_or_compute(
+            filename,
+            [algorithm],
+            lambda _: {algorithm: file_etag(filename, part_size)},
+        )[algorithm]
+    digests = []
+    buffer = bytearray(MB)
+    view = memoryview(buffer)
+    with open(filename, 'rb') as f:
+        while True:
+            md5, remaining = hashlib.md5(), part_size
+            while remaining > 0:
+                n = f.readinto(view[:min(MB, remaining)])
+                if n == 0:
+                    break
+                md5.update(view[:n])
+                remaining -= n
+            if remaining == part_size and len(digests) > 0:
+                break
+            digests.append(md5.digest())
+            if remaining > 0:
+                break
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def sync(src: str, dst: str, delete: bool = False, dry_run: bool = False) -> SyncResult:
+    """
+    `S3.sync` with credentials from `~/.s3config`, e.g. `sync('data/', 's3://bucket/data/', delete=True)`
+    """
+    return S3.from_s3config().sync(src, dst, delete=delete, dry_run=dry_run)
+
+
+def init(key='s3.init',
+         overwrite: bool = False,
+         cache: bool = True,
+         link: str = 'hardlink',
+         workers: int = 4,
+         cache_max_age: float | None = transfers.PREFETCH_CACHE_MAX_AGE):
     """
     Download from s3 to local according to `s3.init` in config yml, which should be
         - a dict
@@ -148,6 +596,11 @@ def init(key='s3.init', overwrite: bool = False):
         hao.s3.init()                   # same as spanner.s3.init('s3.init')
         hao.s3.init('s3.init')          # download `model.general` and `model.product`
         hao.s3.init('model.general')    # download `model.general`
+
+    :param cache: fetched once per host into the shared cache and linked, see `S3.prefetch`
+    :param link: `hardlink` or `symlink` from the cache
+    :param workers: entries downloaded concurrently
+    :param cache_max_age: seconds, the cache entries no longer linked and not used for as long are evicted
     """
 
     s3 = S3.from_s3config()
@@ -161,13 +614,23 @@ def init(key='s3.init', overwrite: bool = False):
     if isinstance(items, str):
         items = config.get(items)
 
+    def _download(_item: dict):
+        path_s3, path_local = _item.get('s3'), _item.get('local')
+        if cache and (overwrite or not os.path.exists(paths.get(path_local))):
+            s3.prefetch(path_s3, path_local, link=link)
+        else:
+            s3.download(path_s3, path_local, overwrite)
+
     if isinstance(items, list):
-        for item in items:
-            item = config.get(item)
-            s3.download(item.get('s3'), item.get('local'), overwrite)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as executor:
+            list(executor.map(_download, [config.get(item) for item in items]))
     elif isinstance(items, dict):
-        s3.download(items.get('s3'), items.get('local'), overwrite)
+        _download(items)
     else:
         LOGGER.error(f"[s3] '{key}' not supported type")
+    if cache:
+        evicted = transfers.evict_prefetch_cache(max_age=cache_max_age)
+        if len(evicted) > 0:
+            LOGGER.info(f"[s3] evicted from the prefetch cache: {len(evicted)} entries no longer linked")
 
     LOGGER.info(f'[s3] init key: {key} finished, took: {sw.took()}')
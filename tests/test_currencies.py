@@ -0,0 +1,26 @@
+import pytest
+
+from hao import currencies
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('1.2亿', 120000000),
+    ('1,234.5万', 12345000),
+    ('三点五万', 35000),
+    ('1点5', 1.5),
+    ('1点5万', 15000),
+    ('1.2.3', None),
+    ('万', None),
+])
+def test_to_number(text, expected):
+    assert currencies.to_number(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('共计1点5万元', [('1点5万元', 15000, '元')]),
+    ('人民币壹佰贰拾万元整', [('人民币壹佰贰拾万元整', 1200000, '元')]),
+    ('单位：万元', []),
+])
+def test_extract_amounts(text, expected):
+    amounts = currencies.extract_amounts(text)
+    assert [(amount.text, amount.value, amount.unit) for amount in amounts] == expected
@@ -0,0 +1,60 @@
+import pytest
+
+from hao import oss
+
+KEYS = sorted(['x/a-b', 'x/a/c', 'x/d/', 'x/f.txt', 'x/g/h/i.txt', 'y/z', 'a.bin', 'z.bin'] + [f"big/{i:05d}" for i in range(5000)])
+
+
+class Object(object):
+    def __init__(self, key):
+        self.key = key
+
+
+class Bucket(object):
+    def __init__(self):
+        self.listed = []
+
+    def object_exists(self, key):
+        return key in KEYS
+
+
+@pytest.fixture
+def client(monkeypatch):
+    bucket = Bucket()
+
+    def iterate(_bucket, prefix='', marker='', **kwargs):
+        for key in KEYS:
+            if key.startswith(prefix) and key > marker:
+                bucket.listed.append(key)
+                yield Object(key)
+
+    monkeypatch.setattr(oss.oss2, 'ObjectIterator', iterate)
+    client = oss.OSS.__new__(oss.OSS)
+    client.get_bucket = lambda name: bucket
+    client.bucket = bucket
+    return client
+
+
+@pytest.mark.parametrize('paths', [
+    ['x/a', 'x/a-b'],
+    ['x/a/', 'x/a-b/'],
+    ['x/a/c', 'x/a', 'x/f.txt', 'x/missing'],
+    ['x/d', 'x/d/', 'x/g', 'x/g/h', 'x/g/h/', 'x/g/h/i.txt/'],
+    ['x/', 'y', 'y/z', 'z'],
+    ['big/00001', 'big/04000', 'big/09999', 'big/04000/'],
+])
+def test_exists_many(client, paths):
+    paths = [f"oss://bk/{path}" for path in paths]
+    assert client.exists_many(paths) == {path: client.is_exist(path) for path in paths}
+
+
+def test_exists_many_without_common_prefix(client):
+    paths = ['oss://bk/a.bin', 'oss://bk/z.bin', 'oss://bk/x/f.txt', 'oss://bk/y/z']
+    assert client.exists_many(paths) == {path: True for path in paths}
+    assert client.bucket.listed == []
+
+
+def test_exists_many_lists_from_the_first_path(client):
+    paths = ['oss://bk/big/02000', 'oss://bk/big/02002', 'oss://bk/big/02002.bak']
+    assert client.exists_many(paths) == {'oss://bk/big/02000': True, 'oss://bk/big/02002': True, 'oss://bk/big/02002.bak': False}
+    assert client.bucket.listed == ['big/02000', 'big/02001', 'big/02002', 'big/02003']
@@ -0,0 +1,57 @@
+import pytest
+
+from hao import transfers
+
+MB = 1024 * 1024
+
+
+@pytest.mark.parametrize('sizes, expected', [
+    ([100 * MB], (1, 13)),
+    ([MB] * 100, (16, 1)),
+    ([MB] * 3, (3, 1)),
+    ([16 * MB] * 100, (8, 2)),
+    ([20 * MB] * 100, (5, 3)),
+    ([MB] * 99 + [100 * MB], (4, 4)),
+])
+def test_plan(sizes, expected):
+    tasks = [(f"f{i}", f"t{i}", size) for i, size in enumerate(sizes)]
+    workers, part_threads = transfers.plan(tasks, part_size=8 * MB, part_threads=4, concurrency=16)
+    assert (workers, part_threads) == expected
+    assert workers * part_threads <= 16
+
+
+def test_run_part_threads_per_file():
+    tasks = [('small', 's', MB), ('large', 'l', 100 * MB), ('empty', 'e', 0)]
+    used = {}
+
+    def transfer(source, target, size, part_threads, progress):
+        used[source] = part_threads
+        progress.done(source, size)
+
+    transfers.run(tasks, transfer, workers=2, part_threads=4, part_size=8 * MB, progress_bar=False)
+    assert used == {'small': 1, 'large': 4, 'empty': 1}
+
+
+def _prefetch(cache_dir, identity, path_local, link='hardlink', size=10):
+    def fetch(target):
+        with open(target, 'wb') as f:
+            f.write(b'0' * size)
+
+    return transfers.prefetch(identity, fetch, str(path_local), link=link, cache_dir=str(cache_dir))
+
+
+def test_evict_prefetch_cache(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    kept = _prefetch(cache_dir, 'kept', tmp_path / 'kept.bin')
+    symlinked = _prefetch(cache_dir, 'symlinked', tmp_path / 'symlinked.bin', link='symlink')
+    unlinked = _prefetch(cache_dir, 'unlinked', tmp_path / 'unlinked.bin')
+    (tmp_path / 'unlinked.bin').unlink()
+
+    assert transfers.evict_prefetch_cache(max_age=None, cache_dir=str(cache_dir)) == []
+    assert transfers.evict_prefetch_cache(max_age=0, cache_dir=str(cache_dir)) == [unlinked]
+
+    (tmp_path / 'symlinked.bin').unlink()
+    assert transfers.evict_prefetch_cache(max_bytes=10, max_age=None, cache_dir=str(cache_dir)) == [symlinked]
+    assert transfers.evict_prefetch_cache(max_bytes=0, max_age=0, cache_dir=str(cache_dir)) == []
+    assert (tmp_path / 'kept.bin').read_bytes() == b'0' * 10
+    assert transfers.prefetch('kept', None, str(tmp_path / 'again.bin'), cache_dir=str(cache_dir)) == kept